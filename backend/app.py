@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify, Response
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
 import os
 import logging
@@ -6,6 +6,11 @@ import json
 from datetime import datetime
 import time
 
+try:
+    import orjson  # C-accelerated encoder for the large graph payloads
+except ImportError:
+    orjson = None
+
 # RADICAL FIX: Force environment loading FIRST
 from config.env_loader import env_loader
 env_loader.ensure_loaded()
@@ -17,7 +22,7 @@ from services.prompt_service import PromptService
 from services.config_service import ConfigService
 from services.prompt_constructor import PromptConstructor
 from services.logging_service import logging_service
-from services.neo4j_service import Neo4jService
+from services.neo4j_service import Neo4jService, LayerExistsError
 
 # Configure logging EARLY
 log_level = env_loader.get_env('LOG_LEVEL', 'INFO')
@@ -36,6 +41,27 @@ app = Flask(__name__)
 app.config.from_object(Config)
 CORS(app)
 
+def graph_json_response(payload):
+    """Serialize a (potentially large) graph payload, using orjson when installed"""
+    if orjson:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False)
+    return Response(body, mimetype='application/json')
+
+def primed_stream(chunks):
+    """Run a chunk generator up to its first chunk now, so errors before any output raise to the caller"""
+    first_chunk = next(chunks)
+    
+    def _stream():
+        try:
+            yield first_chunk
+            yield from chunks
+        finally:
+            chunks.close()
+    
+    return _stream()
+
 # RADICAL FIX: Initialize services with explicit environment checking
 logger.info("🔧 Initializing services...")
 
@@ -872,7 +898,7 @@ def handle_graph_nodes():
     if request.method == 'GET':
         try:
             graph_data = neo4j_service.get_all_nodes_and_edges()
-            return jsonify({"success": True, "data": graph_data})
+            return graph_json_response({"success": True, "data": graph_data})
         except Exception as e:
             logger.error(f"Error getting graph nodes: {str(e)}")
             return jsonify({"success": False, "error": str(e)}), 500
@@ -887,6 +913,9 @@ def handle_graph_nodes():
             
             created_node = neo4j_service.create_node(node_data)
             return jsonify({"success": True, "node": created_node})
+        except ValueError as e:
+            logger.error(f"Validation error creating graph node: {str(e)}")
+            return jsonify({"success": False, "error": str(e)}), 400
         except Exception as e:
             logger.error(f"Error creating graph node: {str(e)}")
             return jsonify({"success": False, "error": str(e)}), 500
@@ -919,13 +948,12 @@ def handle_custom_layers():
             if not layer_name:
                 return jsonify({"success": False, "error": "Layer name cannot be empty"}), 400
             
-            # Check if layer already exists
-            existing_layers = neo4j_service.get_all_layers()
-            if layer_name in existing_layers:
-                return jsonify({"success": False, "error": "Layer already exists"}), 400
-            
+            # create_custom_layer rejects names already used by a custom layer or by nodes
             created_layer = neo4j_service.create_custom_layer(layer_name, layer_description)
             return jsonify({"success": True, "layer": created_layer})
+        except LayerExistsError as e:
+            logger.warning(f"Rejected custom layer: {str(e)}")
+            return jsonify({"success": False, "error": "Layer already exists"}), 400
         except Exception as e:
             logger.error(f"Error creating custom layer: {str(e)}")
             return jsonify({"success": False, "error": str(e)}), 500
@@ -949,6 +977,9 @@ def create_graph_edge():
         
         created_edge = neo4j_service.create_edge(from_id, to_id, relationship_type)
         return jsonify({"success": True, "edge": created_edge})
+    except ValueError as e:
+        logger.error(f"Validation error creating graph edge: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         logger.error(f"Error creating graph edge: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
@@ -1102,8 +1133,9 @@ def save_graph():
                 "error": f"Invalid graph_type '{graph_type}'. Must be one of: {valid_types}"
             }), 400
         
-        # Get current graph data
-        graph_data = neo4j_service.get_all_nodes_and_edges()
+        # Get current graph data straight from the database; the TTL cache could miss
+        # edits made through another worker process
+        graph_data = neo4j_service.get_all_nodes_and_edges(use_cache=False)
         
         if not graph_data['nodes']:
             return jsonify({"success": False, "error": "No graph data to save"}), 400
@@ -1158,7 +1190,7 @@ def get_saved_graph_data(graph_name):
         graph_data = neo4j_service.get_saved_graph_data(graph_name)
         
         if graph_data:
-            return jsonify({
+            return graph_json_response({
                 "success": True,
                 "data": graph_data
             })
@@ -1266,16 +1298,16 @@ def export_graph():
         options = request.json or {}
         include_metadata = options.get('include_metadata', True)
         
-        # Export graph data
-        export_data = neo4j_service.export_graph_data(include_metadata=include_metadata)
-        
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"vibe_graph_export_{timestamp}.json"
         
-        # Create response with proper headers for file download
-        response = Response(
-            json.dumps(export_data, indent=2, ensure_ascii=False),
+        # Stream the document as rows are read, so large graphs are never
+        # materialized in memory; the first chunk is produced here, inside the try,
+        # so a missing driver or failed query still answers 500 instead of a truncated 200
+        chunks = primed_stream(neo4j_service.iter_export_json(include_metadata=include_metadata))
+        return Response(
+            stream_with_context(chunks),
             mimetype='application/json',
             headers={
                 'Content-Disposition': f'attachment; filename="{filename}"',
@@ -1283,9 +1315,6 @@ def export_graph():
             }
         )
         
-        logger.info(f"Graph exported successfully: {export_data['statistics']}")
-        return response
-        
     except Exception as e:
         logger.error(f"Error exporting graph: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
@@ -1297,35 +1326,8 @@ def get_export_info():
         return jsonify({"success": False, "error": "Neo4j service not available"}), 503
     
     try:
-        # Get current graph data for statistics
-        graph_data = neo4j_service.get_all_nodes_and_edges()
-        custom_layers = neo4j_service.get_custom_layers()
-        
-        # Calculate statistics
-        layer_stats = {}
-        for node in graph_data['nodes']:
-            layer = node['layer'] or 'Other'
-            if layer not in layer_stats:
-                layer_stats[layer] = {'nodes': 0, 'types': set()}
-            layer_stats[layer]['nodes'] += 1
-            layer_stats[layer]['types'].add(node['type'])
-        
-        # Convert sets to lists for JSON serialization
-        for layer in layer_stats:
-            layer_stats[layer]['types'] = list(layer_stats[layer]['types'])
-        
-        export_info = {
-            'statistics': {
-                'total_nodes': len(graph_data['nodes']),
-                'total_edges': len(graph_data['edges']),
-                'total_layers': len(set(node['layer'] for node in graph_data['nodes'] if node['layer'])),
-                'custom_layers_count': len(custom_layers)
-            },
-            'layer_statistics': layer_stats,
-            'relationship_types': list(set(edge['type'] for edge in graph_data['edges'])),
-            'node_types': list(set(node['type'] for node in graph_data['nodes'])),
-            'custom_layers': custom_layers
-        }
+        # Statistics are aggregated in Cypher; no node or edge rows are fetched
+        export_info = neo4j_service.get_graph_summary()
         
         return jsonify({"success": True, "export_info": export_info})
         
@@ -1468,28 +1470,9 @@ def update_graph_type(graph_name):
             }), 400
         
         # Update the graph type in Neo4j
-        with neo4j_service.driver.session() as session:
-            # Check if graph exists
-            check_query = """
-            MATCH (sg:SavedGraph {name: $graph_name})
-            RETURN count(sg) as count
-            """
-            result = session.run(check_query, {'graph_name': graph_name})
-            if result.single()['count'] == 0:
-                return jsonify({"success": False, "error": f"Graph '{graph_name}' not found"}), 404
-            
-            # Update the graph type
-            update_query = """
-            MATCH (sg:SavedGraph {name: $graph_name})
-            SET sg.graph_type = $graph_type, sg.updated_at = datetime()
-            RETURN sg
-            """
-            session.run(update_query, {
-                'graph_name': graph_name,
-                'graph_type': new_graph_type
-            })
+        if not neo4j_service.update_saved_graph_type(graph_name, new_graph_type):
+            return jsonify({"success": False, "error": f"Graph '{graph_name}' not found"}), 404
         
-        logger.info(f"Graph '{graph_name}' type updated to '{new_graph_type}'")
         return jsonify({
             "success": True, 
             "message": f"Graph '{graph_name}' type updated to '{new_graph_type}'"
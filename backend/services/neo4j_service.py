@@ -1,18 +1,551 @@
 import os
+import atexit
+import json
 import logging
-from typing import Dict, List, Any, Optional
-from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable, AuthError
-from datetime import datetime
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from neo4j import GraphDatabase, Driver, READ_ACCESS, Result, RoutingControl
+from neo4j.exceptions import ServiceUnavailable, AuthError, ClientError
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Pending create_node/create_edge calls are coalesced into one transaction
+# once this many are queued or the oldest has waited this long
+WRITE_BATCH_SIZE = int(os.getenv('NEO4J_WRITE_BATCH_SIZE', '500'))
+WRITE_BATCH_WAIT_SECONDS = float(os.getenv('NEO4J_WRITE_BATCH_WAIT_MS', '50')) / 1000
+
+# Longest a create_node/create_edge caller waits for its queued write to be picked up;
+# a write still queued at the deadline is withdrawn and never committed
+WRITE_RESULT_TIMEOUT_SECONDS = float(os.getenv('NEO4J_WRITE_TIMEOUT', '30'))
+
+# Relationship types the editor offers; anything else is rejected before it reaches Cypher
+ALLOWED_RELATIONSHIP_TYPES = frozenset({
+    'LINKED_TO', 'DEPENDS_ON', 'SUPPORTS', 'CONFLICTS_WITH', 'ENABLES'
+})
+
+# The saved-graph listing is polled by the UI but only changes on save/delete
+SAVED_GRAPHS_CACHE_TTL_SECONDS = 2.0
+
+# Every API route checks is_connected first; a probe result is reused this long
+LIVENESS_CHECK_INTERVAL_SECONDS = 5.0
+
+# Full-graph snapshot served to page loads; every main-graph write drops it, and the
+# short TTL bounds staleness from writes made outside this process
+GRAPH_CACHE_TTL_SECONDS = float(os.getenv('GRAPH_CACHE_TTL', '5'))
+
+# Imports beyond these sizes are rejected before any per-row validation runs
+IMPORT_MAX_NODES = int(os.getenv('IMPORT_MAX_NODES', '100000'))
+IMPORT_MAX_EDGES = int(os.getenv('IMPORT_MAX_EDGES', '250000'))
+
+# Imports with more node + edge rows than this are committed server-side in
+# batches (CALL {} IN TRANSACTIONS) rather than as one transaction
+IMPORT_IN_TRANSACTIONS_THRESHOLD = 20000
+
+# Streamed exports are sent in chunks of roughly this many characters
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Cypher is kept in module-level constants so every call sends identical
+# query text and Neo4j can reuse its cached plan.
+
+_SCHEMA_QUERIES = (
+    "CREATE CONSTRAINT node_id IF NOT EXISTS FOR (n:Node) REQUIRE n.id IS UNIQUE",
+    "CREATE CONSTRAINT saved_graph_name IF NOT EXISTS FOR (sg:SavedGraph) REQUIRE sg.name IS UNIQUE",
+    "CREATE CONSTRAINT custom_layer_name IF NOT EXISTS FOR (l:CustomLayer) REQUIRE l.name IS UNIQUE",
+    "CREATE INDEX node_layer IF NOT EXISTS FOR (n:Node) ON (n.layer)",
+    "CREATE INDEX saved_node_graph IF NOT EXISTS FOR (sn:SavedNode) ON (sn.graph_name)",
+    "CREATE INDEX saved_edge_graph IF NOT EXISTS FOR (se:SavedEdge) ON (se.graph_name)"
+)
+
+# Main graph
+_Q_BATCH_MERGE_NODES = """
+UNWIND $rows AS row
+MERGE (n:Node {id: row.id})
+SET n.name = row.name,
+    n.description = row.description,
+    n.layer = row.layer,
+    n.type = row.type,
+    n.created_at = coalesce(n.created_at, $now),
+    n.updated_at = $now
+"""
+
+_Q_BATCH_MERGE_EDGES = """
+UNWIND $rows AS row
+MATCH (a:Node {id: row.from_id})
+MATCH (b:Node {id: row.to_id})
+CALL apoc.merge.relationship(a, row.type, {}, {created_at: $now},
+                             b, {created_at: $now})
+YIELD rel
+RETURN row.from_id as from_id, row.to_id as to_id, row.type as type
+"""
+
+# One :Node scan for the whole graph: each row is a node plus its outgoing edges
+# (collect() drops the null produced for nodes without any)
+_Q_GET_GRAPH = """
+MATCH (n:Node)
+OPTIONAL MATCH (n)-[r]->(m:Node)
+WITH n, collect(CASE WHEN m IS NULL THEN null
+                     ELSE {from_id: n.id, to_id: m.id, type: type(r)} END) as edges
+RETURN n {.id, .name, .description, .layer, .type} as node, edges
+ORDER BY n.layer, n.name
+"""
+
+_Q_UPDATE_NODE = """
+MATCH (n:Node {id: $node_id})
+SET n.name = $name,
+    n.description = $description,
+    n.layer = $layer,
+    n.type = $type,
+    n.updated_at = datetime()
+RETURN n {.id, .name, .description, .layer, .type} as node
+"""
+
+_Q_DELETE_NODE = """
+MATCH (n:Node {id: $node_id})
+DETACH DELETE n
+"""
+
+_Q_DELETE_EDGE = """
+MATCH (a:Node {id: $from_id})-[r]->(b:Node {id: $to_id})
+WHERE $relationship_type IS NULL OR type(r) = $relationship_type
+DELETE r
+"""
+
+# Bulk deletes commit every 1000 nodes so the transaction state stays bounded;
+# CALL {} IN TRANSACTIONS only runs in an auto-commit transaction (session.run)
+_Q_DELETE_LAYER_NODES = """
+MATCH (n:Node {layer: $layer_name})
+CALL {
+    WITH n
+    DETACH DELETE n
+} IN TRANSACTIONS OF 1000 ROWS
+"""
+
+_Q_CLEAR_ALL_DATA = """
+MATCH (n)
+WHERE NOT n:SavedGraph AND NOT n:SavedNode AND NOT n:SavedEdge
+CALL {
+    WITH n
+    DETACH DELETE n
+} IN TRANSACTIONS OF 1000 ROWS
+"""
+
+# Same clear as a plain statement, for use inside a larger write transaction
+_Q_CLEAR_ALL_DATA_TX = """
+MATCH (n)
+WHERE NOT n:SavedGraph AND NOT n:SavedNode AND NOT n:SavedEdge
+DETACH DELETE n
+"""
+
+# Saved graphs
+_Q_PURGE_SAVED_GRAPH = """
+OPTIONAL MATCH (sg:SavedGraph {name: $graph_name})
+DETACH DELETE sg
+WITH count(*) AS _
+OPTIONAL MATCH (sn:SavedNode {graph_name: $graph_name})
+DELETE sn
+WITH count(*) AS _
+OPTIONAL MATCH (se:SavedEdge {graph_name: $graph_name})
+DELETE se
+"""
+
+# The SavedGraph header plus every node and edge row in one statement; each
+# unit subquery runs its UNWIND once without multiplying the outer row
+_Q_SAVE_GRAPH = """
+CREATE (sg:SavedGraph {
+    name: $graph_name,
+    graph_type: $graph_type,
+    created_at: $now,
+    nodes_count: size($nodes),
+    edges_count: size($edges)
+})
+WITH sg
+CALL {
+    UNWIND $nodes AS row
+    CREATE (:SavedNode {
+        graph_name: $graph_name,
+        id: row.id,
+        name: row.name,
+        description: row.description,
+        layer: row.layer,
+        type: row.type
+    })
+}
+CALL {
+    UNWIND $edges AS row
+    CREATE (:SavedEdge {
+        graph_name: $graph_name,
+        from_id: row.from_id,
+        to_id: row.to_id,
+        type: row.type
+    })
+}
+"""
+
+# created_at is formatted server-side so each row arrives as plain strings and numbers
+_Q_GET_SAVED_GRAPHS_BY_TYPE = """
+MATCH (sg:SavedGraph {graph_type: $graph_type})
+RETURN sg.name as name, sg.graph_type as graph_type, toString(sg.created_at) as created_at,
+       sg.nodes_count as nodes_count, sg.edges_count as edges_count
+ORDER BY sg.created_at DESC
+"""
+
+_Q_GET_SAVED_GRAPHS = """
+MATCH (sg:SavedGraph)
+RETURN sg.name as name,
+       COALESCE(sg.graph_type, 'nfr') as graph_type,
+       toString(sg.created_at) as created_at,
+       sg.nodes_count as nodes_count, sg.edges_count as edges_count
+ORDER BY sg.created_at DESC
+"""
+
+# Existence check plus the full payload in one round-trip: no row comes back when
+# the saved graph doesn't exist, and each collect() yields [] for an empty graph
+_Q_GET_SAVED_GRAPH_DATA = """
+MATCH (sg:SavedGraph {name: $graph_name})
+CALL {
+    MATCH (sn:SavedNode {graph_name: $graph_name})
+    RETURN collect(sn {.id, .name, .description, .layer, .type}) as nodes
+}
+CALL {
+    MATCH (se:SavedEdge {graph_name: $graph_name})
+    RETURN collect(se {.from_id, .to_id, .type}) as edges
+}
+RETURN nodes, edges
+"""
+
+# Existence check plus the node and edge copy in one statement: no row comes
+# back when the saved graph doesn't exist. Nodes are copied before edges so
+# the edge subquery can match its endpoints; the stored type goes to APOC as data.
+_Q_LOAD_SAVED_GRAPH = """
+MATCH (sg:SavedGraph {name: $graph_name})
+CALL {
+    MATCH (sn:SavedNode {graph_name: $graph_name})
+    MERGE (n:Node {id: sn.id})
+    SET n.name = sn.name,
+        n.description = sn.description,
+        n.layer = sn.layer,
+        n.type = sn.type,
+        n.created_at = coalesce(n.created_at, $now),
+        n.updated_at = $now
+}
+CALL {
+    MATCH (se:SavedEdge {graph_name: $graph_name})
+    MATCH (a:Node {id: se.from_id})
+    MATCH (b:Node {id: se.to_id})
+    CALL apoc.merge.relationship(a, se.type, {}, {created_at: $now},
+                                 b, {created_at: $now})
+    YIELD rel
+    RETURN count(rel) as edges_loaded
+}
+RETURN sg.name as name, edges_loaded
+"""
+
+_Q_UPDATE_SAVED_GRAPH_TYPE = """
+MATCH (sg:SavedGraph {name: $graph_name})
+SET sg.graph_type = $graph_type, sg.updated_at = datetime()
+RETURN sg.name as name
+"""
+
+# SavedNode/SavedEdge rows are linked to their graph by graph_name, not by relationships
+_Q_DELETE_SAVED_GRAPH = """
+MATCH (g:SavedGraph {name: $name})
+CALL {
+    MATCH (sn:SavedNode {graph_name: $name})
+    DELETE sn
+}
+CALL {
+    MATCH (se:SavedEdge {graph_name: $name})
+    DELETE se
+}
+DETACH DELETE g
+RETURN count(*) as deleted
+"""
+
+# Layers
+_Q_GET_CUSTOM_LAYERS = "MATCH (l:CustomLayer) RETURN l.name as name ORDER BY l.name"
+
+_Q_GET_ALL_LAYERS = """
+CALL {
+    MATCH (l:CustomLayer) RETURN l.name as layer
+    UNION
+    MATCH (n:Node) WHERE n.layer IS NOT NULL RETURN DISTINCT n.layer as layer
+}
+RETURN layer ORDER BY layer
+"""
+
+# MERGE doubles as the existence check: an existing layer is matched untouched, a
+# name already used by nodes skips the MERGE, and the nodes_created counter tells
+# the caller whether anything was created
+_Q_CREATE_CUSTOM_LAYER = """
+WITH $name AS name
+WHERE NOT EXISTS { MATCH (:Node {layer: name}) }
+MERGE (l:CustomLayer {name: name})
+ON CREATE SET l.description = $description,
+              l.created_at = datetime()
+RETURN l {.name, .description, .created_at} as layer
+"""
+
+_Q_DELETE_CUSTOM_LAYER = """
+MATCH (l:CustomLayer {name: $layer_name})
+DELETE l
+"""
+
+# Rename check, layer upsert and node relabel in one statement. When the new name
+# is already taken the subquery does nothing and name_taken comes back true.
+_Q_UPDATE_CUSTOM_LAYER = """
+WITH $old_name <> $new_name AND (
+       EXISTS { MATCH (:CustomLayer {name: $new_name}) } OR
+       EXISTS { MATCH (:Node {layer: $new_name}) }
+     ) as name_taken
+CALL {
+    WITH name_taken
+    WITH name_taken WHERE NOT name_taken
+    MERGE (l:CustomLayer {name: $old_name})
+    ON CREATE SET l.created_at = $now
+    SET l.name = $new_name,
+        l.description = $description,
+        l.updated_at = $now
+    WITH l
+    OPTIONAL MATCH (n:Node {layer: $old_name})
+    WHERE $old_name <> $new_name
+    SET n.layer = $new_name,
+        n.updated_at = $now
+    RETURN count(n) as updated_count
+}
+RETURN name_taken, updated_count
+"""
+
+# Export / import
+# Export columns are aliased to the export keys and timestamps are formatted server-side,
+# so each record maps straight through data()
+_Q_EXPORT_NODES = """
+MATCH (n:Node)
+RETURN n.id as id, n.name as name, n.description as description, 
+       n.layer as layer, n.type as type
+ORDER BY n.layer, n.name
+"""
+
+_Q_EXPORT_NODES_WITH_METADATA = """
+MATCH (n:Node)
+RETURN n.id as id, n.name as name, n.description as description, 
+       n.layer as layer, n.type as type,
+       toString(n.created_at) as created_at, toString(n.updated_at) as updated_at
+ORDER BY n.layer, n.name
+"""
+
+_Q_EXPORT_EDGES = """
+MATCH (a:Node)-[r]->(b:Node)
+RETURN a.id as from_id, b.id as to_id, type(r) as type
+"""
+
+_Q_EXPORT_EDGES_WITH_METADATA = """
+MATCH (a:Node)-[r]->(b:Node)
+RETURN a.id as from_id, b.id as to_id, type(r) as type,
+       toString(r.created_at) as created_at
+"""
+
+# Export statistics are aggregated server-side: one row per layer and one per
+# relationship type, however large the graph is
+_Q_LAYER_STATISTICS = """
+MATCH (n:Node)
+RETURN n.layer as layer, count(n) as nodes, collect(DISTINCT n.type) as types
+"""
+
+_Q_RELATIONSHIP_STATISTICS = """
+MATCH (:Node)-[r]->(:Node)
+RETURN type(r) as type, count(r) as edges
+"""
+
+# Server-batched variants of the node/edge merges for very large imports: each
+# 10000 rows commit on their own, so the transaction state stays bounded
+_Q_IMPORT_NODES_IN_TRANSACTIONS = """
+UNWIND $rows AS row
+CALL {
+    WITH row
+    MERGE (n:Node {id: row.id})
+    SET n.name = row.name,
+        n.description = row.description,
+        n.layer = row.layer,
+        n.type = row.type,
+        n.created_at = coalesce(n.created_at, $now),
+        n.updated_at = $now
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+_Q_IMPORT_EDGES_IN_TRANSACTIONS = """
+UNWIND $rows AS row
+CALL {
+    WITH row
+    MATCH (a:Node {id: row.from_id})
+    MATCH (b:Node {id: row.to_id})
+    CALL apoc.merge.relationship(a, row.type, {}, {created_at: $now},
+                                 b, {created_at: $now})
+    YIELD rel
+    RETURN row.from_id as from_id, row.to_id as to_id, row.type as type
+} IN TRANSACTIONS OF 10000 ROWS
+RETURN from_id, to_id, type
+"""
+
+_Q_IMPORT_CUSTOM_LAYERS = """
+UNWIND $names AS name
+MERGE (l:CustomLayer {name: name})
+ON CREATE SET l.created_at = $now
+"""
+
+def _driver_kwargs() -> Dict[str, Any]:
+    """Connection-pool settings for the Neo4j driver"""
+    return {
+        'max_connection_pool_size': int(os.getenv('NEO4J_POOL_SIZE', '50')),
+        'connection_acquisition_timeout': float(os.getenv('NEO4J_ACQ_TIMEOUT', '60')),
+        'max_connection_lifetime': 3600,
+        'keep_alive': True,
+        'connection_timeout': 15
+    }
+
+def _normalize_relationship_type(rel_type):
+    """Upper-case a relationship type so legacy lowercase values (e.g. 'depends_on') match the whitelist"""
+    return rel_type.upper() if isinstance(rel_type, str) else rel_type
+
+def _isoformat(value) -> Optional[str]:
+    """ISO-8601 string for a Neo4j temporal value, None when the property is unset"""
+    return value.isoformat() if value else None
+
+def _utcnow() -> datetime:
+    """Timestamp for a write, bound once as $now instead of calling datetime() per row"""
+    return datetime.now(timezone.utc)
+
+def _graph_summary(layer_rows: List[Dict[str, Any]], relationship_rows: List[Dict[str, Any]],
+                   custom_layers: List[str]) -> Dict[str, Any]:
+    """Export statistics from the per-layer and per-relationship-type aggregate rows"""
+    layer_stats = {}
+    node_types = set()
+    for row in layer_rows:
+        # Unset and empty layers both report as 'Other'
+        stats = layer_stats.setdefault(row['layer'] or 'Other', {'nodes': 0, 'types': []})
+        stats['nodes'] += row['nodes']
+        stats['types'].extend(node_type for node_type in row['types'] if node_type not in stats['types'])
+        node_types.update(row['types'])
+    
+    return {
+        'statistics': {
+            'total_nodes': sum(row['nodes'] for row in layer_rows),
+            'total_edges': sum(row['edges'] for row in relationship_rows),
+            'total_layers': sum(1 for row in layer_rows if row['layer']),
+            'custom_layers_count': len(custom_layers)
+        },
+        'layer_statistics': layer_stats,
+        'relationship_types': [row['type'] for row in relationship_rows],
+        'node_types': list(node_types)
+    }
+
+# Fields every imported node/edge must carry as strings
+_IMPORT_NODE_FIELDS = ('id', 'name', 'layer', 'type')
+_IMPORT_EDGE_FIELDS = ('from_id', 'to_id', 'type')
+
+def _field_errors(kind: str, index: int, item: Dict[str, Any], fields: Tuple[str, ...]) -> List[str]:
+    """Per-field validation messages for an import row that failed the quick check"""
+    errors = []
+    for field in fields:
+        if field not in item:
+            errors.append(f'{kind} at index {index} missing required field: {field}')
+        elif not isinstance(item[field], str):
+            errors.append(f'{kind} at index {index} field {field} must be a string')
+    return errors
+
+def _import_rows(graph_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Node and edge rows for the batch MERGE statements from validated import data"""
+    node_rows = [
+        {
+            'id': node['id'],
+            'name': node['name'],
+            'description': node.get('description', ''),
+            'layer': node['layer'],
+            'type': node['type']
+        }
+        for node in graph_data['nodes']
+    ]
+    # Legacy lowercase types are upper-cased; edges of unsupported types were reported
+    # as warnings during validation and are left out here
+    edge_rows = []
+    for edge in graph_data['edges']:
+        rel_type = _normalize_relationship_type(edge['type'])
+        if rel_type in ALLOWED_RELATIONSHIP_TYPES:
+            edge_rows.append({
+                'from_id': edge['from_id'],
+                'to_id': edge['to_id'],
+                'type': rel_type
+            })
+    return node_rows, edge_rows
+
+def _import_statistics(layers_created: int, nodes_created: int, node_rows: List[Dict[str, Any]],
+                       edge_rows: List[Dict[str, Any]], created_edges: set) -> Dict[str, Any]:
+    """Counts and per-edge errors for an import response"""
+    import_stats = {
+        'nodes_created': nodes_created,
+        'nodes_updated': len(node_rows) - nodes_created,
+        'edges_created': 0,
+        'layers_created': layers_created,
+        'errors': []
+    }
+    for edge in edge_rows:
+        if (edge['from_id'], edge['to_id'], edge['type']) in created_edges:
+            import_stats['edges_created'] += 1
+        else:
+            import_stats['errors'].append(
+                f"Cannot create edge {edge['from_id']} -> {edge['to_id']}: one or both nodes don't exist"
+            )
+    return import_stats
+
+class LayerExistsError(ValueError):
+    """Raised when a custom layer name is already used by a custom layer or by nodes"""
+
 class Neo4jService:
     """Service for managing Neo4j graph database operations"""
     
+    # One instance (and so one driver and connection pool) per process
+    _instance: Optional["Neo4jService"] = None
+    _instance_lock = threading.Lock()
+    
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+    
     def __init__(self):
+        with self._instance_lock:
+            if self._initialized:
+                return
+            self._initialized = True
+        
         self.driver: Optional[Driver] = None
+        # Naming the database up front skips the home-database resolution round-trip
+        self._db = os.getenv('NEO4J_DATABASE', 'neo4j')
+        self._saved_graphs_cache: Dict[Optional[str], Any] = {}
+        self._graph_cache: Tuple[Optional[Dict[str, Any]], float] = (None, 0.0)
+        # Bumped by every invalidation; a read only caches its snapshot if no write landed meanwhile
+        self._graph_generation = 0
+        self._graph_cache_lock = threading.Lock()
+        self._liveness: Tuple[bool, float] = (False, 0.0)
+        self._schema_ready = False
         self._connect()
+        
+        self._start_write_batcher()
+        atexit.register(self.close)
+    
+    def _start_write_batcher(self):
+        """Start the background thread that coalesces create_node/create_edge calls"""
+        self._write_q: "queue.Queue" = queue.Queue()
+        self._write_lock = threading.Lock()
+        self._write_closed = False
+        self._write_worker = threading.Thread(target=self._flush_loop, name="neo4j-write-batcher", daemon=True)
+        self._write_worker.start()
     
     def _connect(self):
         """Establish connection to Neo4j database"""
@@ -21,13 +554,11 @@ class Neo4jService:
             user = os.getenv('NEO4J_USERNAME', 'neo4j')
             password = os.getenv('NEO4J_PASSWORD', 'vibeassistant')
             
-            self.driver = GraphDatabase.driver(uri, auth=(user, password))
-            
-            # Test connection
-            with self.driver.session() as session:
-                session.run("RETURN 1")
+            # The driver connects lazily; query paths surface ServiceUnavailable themselves
+            self.driver = GraphDatabase.driver(uri, auth=(user, password), **_driver_kwargs())
+            logger.info("✅ Neo4j driver initialized")
             
-            logger.info("✅ Neo4j connection established successfully")
+            self._ensure_schema()
             
         except (ServiceUnavailable, AuthError) as e:
             logger.error(f"❌ Failed to connect to Neo4j: {e}")
@@ -36,62 +567,214 @@ class Neo4jService:
             logger.error(f"❌ Unexpected error connecting to Neo4j: {e}")
             self.driver = None
     
+    def _ensure_schema(self):
+        """Create the constraints and indexes every MATCH/MERGE on the graph relies on"""
+        try:
+            with self.session() as session:
+                for query in _SCHEMA_QUERIES:
+                    try:
+                        session.run(query).consume()
+                    except (ServiceUnavailable, AuthError):
+                        raise
+                    except Exception as e:
+                        # Existing duplicate data blocks a constraint; keep serving without it
+                        logger.warning(f"⚠️ Could not apply Neo4j schema statement '{query}': {e}")
+            self._schema_ready = True
+        except (ServiceUnavailable, AuthError) as e:
+            logger.warning(f"⚠️ Neo4j not reachable yet, schema setup skipped: {e}")
+    
     def is_connected(self) -> bool:
-        """Check if Neo4j connection is active"""
+        """Check if Neo4j connection is active, reconnecting if startup failed"""
+        alive, checked_at = self._liveness
+        if time.monotonic() - checked_at < LIVENESS_CHECK_INTERVAL_SECONDS:
+            return alive
+        
         if not self.driver:
-            return False
+            self._connect()
         
-        try:
-            with self.driver.session() as session:
-                session.run("RETURN 1")
-            return True
-        except Exception:
-            return False
+        alive = False
+        if self.driver:
+            try:
+                self.driver.verify_connectivity()
+                alive = True
+            except Exception:
+                alive = False
+        
+        # Neo4j may have been down at startup; apply the schema once it answers
+        if alive and not self._schema_ready:
+            self._ensure_schema()
+        
+        self._liveness = (alive, time.monotonic())
+        return alive
+    
+    def session(self, **kwargs):
+        """Open a driver session bound to the configured database"""
+        # Share execute_query's bookmark manager so every session and execute_query call
+        # sees the writes before it, even when reads are routed to a cluster follower
+        kwargs.setdefault('bookmark_manager', self.driver.execute_query_bookmark_manager)
+        return self.driver.session(database=self._db, **kwargs)
     
     def close(self):
         """Close Neo4j connection"""
+        # Let the batcher flush what is already queued before the driver goes away
+        with self._write_lock:
+            if self._write_closed:
+                return
+            self._write_closed = True
+            self._write_q.put(None)
+        self._write_worker.join()
+        
         if self.driver:
             self.driver.close()
             logger.info("Neo4j connection closed")
     
+    def invalidate_saved_graphs_cache(self):
+        """Drop cached saved-graph listings after a SavedGraph node changes"""
+        self._saved_graphs_cache.clear()
+    
+    def invalidate_graph_cache(self):
+        """Drop the cached full-graph snapshot after the main graph changes"""
+        with self._graph_cache_lock:
+            self._graph_generation += 1
+            self._graph_cache = (None, 0.0)
+    
+    def _enqueue_write(self, kind: str, row: Dict[str, Any]) -> Future:
+        """Queue a node or edge write for the background batcher"""
+        future: Future = Future()
+        # Checked under the lock so nothing lands behind the shutdown sentinel
+        with self._write_lock:
+            if self._write_closed:
+                raise Exception("Neo4j write batcher is closed")
+            self._write_q.put((kind, row, future))
+        return future
+    
+    @staticmethod
+    def _await_write(future: Future) -> Any:
+        """Wait for a queued write, withdrawing it if it hasn't started by the timeout"""
+        try:
+            return future.result(timeout=WRITE_RESULT_TIMEOUT_SECONDS)
+        except FutureTimeoutError:
+            # A cancelled write is skipped by the batcher, so a write reported as failed
+            # never lands; one already being committed can't be withdrawn, so wait it out
+            if future.cancel():
+                raise
+            return future.result()
+    
+    def _flush_loop(self):
+        """Drain queued writes into batches bounded by size and wait time"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            
+            batch = [item]
+            deadline = time.monotonic() + WRITE_BATCH_WAIT_SECONDS
+            stop = False
+            while len(batch) < WRITE_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            
+            # Callers that timed out while their write was queued have cancelled it
+            batch = [item for item in batch if item[2].set_running_or_notify_cancel()]
+            if batch:
+                self._flush_batch(batch)
+            if stop:
+                return
+    
+    def _flush_batch(self, batch: List[Any]):
+        """Write a batch of queued nodes and edges in one transaction and resolve their futures"""
+        node_items = [(row, future) for kind, row, future in batch if kind == 'node']
+        edge_items = [(row, future) for kind, row, future in batch if kind == 'edge']
+        
+        def _write(tx):
+            # Nodes go first so edges queued in the same batch can find their endpoints
+            self._merge_nodes(tx, [row for row, _ in node_items])
+            return self._merge_edges(tx, [row for row, _ in edge_items])
+        
+        try:
+            with self.session() as session:
+                created_edges = session.execute_write(_write)
+            self.invalidate_graph_cache()
+                
+        except Exception as e:
+            logger.error(f"Error flushing batch of {len(batch)} graph writes: {e}")
+            if len(batch) > 1 and isinstance(e, ClientError) and not isinstance(e, AuthError):
+                # A rejected row aborts the shared transaction; retry each write on its own
+                # so only the caller that sent it sees the failure. Transient and connection
+                # errors would hit every retry the same way, so they fail the batch at once.
+                for item in batch:
+                    self._flush_batch([item])
+            else:
+                for _, _, future in batch:
+                    future.set_exception(e)
+            return
+        
+        for row, future in node_items:
+            future.set_result(row)
+        
+        for row, future in edge_items:
+            future.set_result(self._edge_result(row, created_edges))
+    
+    @staticmethod
+    def _merge_nodes(tx, rows: List[Dict[str, Any]]) -> int:
+        """MERGE node rows inside a write transaction with one UNWIND statement; returns how many were new"""
+        if not rows:
+            return 0
+        summary = tx.run(_Q_BATCH_MERGE_NODES, {'rows': rows, 'now': _utcnow()}).consume()
+        return summary.counters.nodes_created
+    
+    @staticmethod
+    def _merge_edges(tx, rows: List[Dict[str, Any]]) -> set:
+        """MERGE edge rows inside a write transaction; returns the (from, to, type) keys created"""
+        if not rows:
+            return set()
+        result = tx.run(_Q_BATCH_MERGE_EDGES, {'rows': rows, 'now': _utcnow()})
+        return {(record['from_id'], record['to_id'], record['type']) for record in result}
+    
+    @staticmethod
+    def _edge_result(row: Dict[str, Any], created_edges: set) -> Dict[str, Any]:
+        """Shape an edge row like create_edge's response"""
+        edge = {
+            'from_id': row['from_id'],
+            'to_id': row['to_id'],
+            'type': row['type']
+        }
+        if (row['from_id'], row['to_id'], row['type']) in created_edges:
+            edge['success'] = True
+        else:
+            edge['success'] = False
+            edge['error'] = 'Nodes not found'
+        return edge
+    
     def create_node(self, node_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new node in the graph"""
         if not self.driver:
             raise Exception("Neo4j connection not available")
         
+        # A null id would abort the batched MERGE for every caller sharing the batch
+        if not isinstance(node_data.get('id'), str):
+            raise ValueError("Node id must be a string")
+        
         try:
-            with self.driver.session() as session:
-                query = """
-                MERGE (n:Node {id: $id})
-                SET n.name = $name,
-                    n.description = $description,
-                    n.layer = $layer,
-                    n.type = $type,
-                    n.created_at = datetime(),
-                    n.updated_at = datetime()
-                RETURN n
-                """
-                
-                result = session.run(query, {
-                    'id': node_data['id'],
-                    'name': node_data['name'],
-                    'description': node_data.get('description', ''),
-                    'layer': node_data.get('layer', ''),
-                    'type': node_data.get('type', '')
-                })
-                
-                record = result.single()
-                if record:
-                    node = record['n']
-                    return {
-                        'id': node['id'],
-                        'name': node['name'],
-                        'description': node['description'],
-                        'layer': node['layer'],
-                        'type': node['type']
-                    }
-                
-                return node_data
+            node = {
+                'id': node_data['id'],
+                'name': node_data['name'],
+                'description': node_data.get('description', ''),
+                'layer': node_data.get('layer', ''),
+                'type': node_data.get('type', '')
+            }
+            
+            # Concurrent callers share one batched commit; wait for ours to land
+            return self._await_write(self._enqueue_write('node', node))
                 
         except Exception as e:
             logger.error(f"Error creating node: {e}")
@@ -102,87 +785,121 @@ class Neo4jService:
         if not self.driver:
             raise Exception("Neo4j connection not available")
         
+        if not isinstance(from_id, str) or not isinstance(to_id, str):
+            raise ValueError("from_id and to_id must be strings")
+        
+        relationship_type = _normalize_relationship_type(relationship_type)
+        if relationship_type not in ALLOWED_RELATIONSHIP_TYPES:
+            raise ValueError(
+                f"Invalid relationship type '{relationship_type}'. "
+                f"Must be one of: {sorted(ALLOWED_RELATIONSHIP_TYPES)}"
+            )
+        
         try:
-            with self.driver.session() as session:
-                query = f"""
-                MATCH (a:Node {{id: $from_id}})
-                MATCH (b:Node {{id: $to_id}})
-                MERGE (a)-[r:{relationship_type}]->(b)
-                SET r.created_at = datetime()
-                RETURN a, r, b
-                """
-                
-                result = session.run(query, {
-                    'from_id': from_id,
-                    'to_id': to_id
-                })
-                
-                record = result.single()
-                if record:
-                    return {
-                        'from_id': from_id,
-                        'to_id': to_id,
-                        'type': relationship_type,
-                        'success': True
-                    }
-                
-                return {
-                    'from_id': from_id,
-                    'to_id': to_id,
-                    'type': relationship_type,
-                    'success': False,
-                    'error': 'Nodes not found'
-                }
+            # Concurrent callers share one batched commit; wait for ours to land
+            return self._await_write(self._enqueue_write('edge', {
+                'from_id': from_id,
+                'to_id': to_id,
+                'type': relationship_type
+            }))
                 
         except Exception as e:
             logger.error(f"Error creating edge: {e}")
             raise
     
-    def get_all_nodes_and_edges(self) -> Dict[str, Any]:
-        """Retrieve all nodes and their relationships"""
+    def bulk_upsert_nodes(self, nodes: List[Dict[str, Any]]) -> int:
+        """Create or update many nodes with a single UNWIND statement"""
         if not self.driver:
             raise Exception("Neo4j connection not available")
         
+        rows = [
+            {
+                'id': node['id'],
+                'name': node['name'],
+                'description': node.get('description', ''),
+                'layer': node.get('layer', ''),
+                'type': node.get('type', '')
+            }
+            for node in nodes
+        ]
+        
         try:
-            with self.driver.session() as session:
-                # Get all nodes
-                nodes_query = """
-                MATCH (n:Node)
-                RETURN n.id as id, n.name as name, n.description as description, 
-                       n.layer as layer, n.type as type
-                ORDER BY n.layer, n.name
-                """
-                
-                nodes_result = session.run(nodes_query)
+            with self.session() as session:
+                session.execute_write(self._merge_nodes, rows)
+            self.invalidate_graph_cache()
+            
+            logger.info(f"Upserted {len(rows)} nodes")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error upserting nodes: {e}")
+            raise
+    
+    def bulk_upsert_edges(self, edges: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """Create many (from_id, to_id, relationship_type) edges with a single UNWIND statement"""
+        if not self.driver:
+            raise Exception("Neo4j connection not available")
+        
+        edges = [
+            (from_id, to_id, _normalize_relationship_type(rel_type))
+            for from_id, to_id, rel_type in edges
+        ]
+        invalid_types = {rel_type for _, _, rel_type in edges} - ALLOWED_RELATIONSHIP_TYPES
+        if invalid_types:
+            raise ValueError(
+                f"Invalid relationship types {sorted(map(str, invalid_types))}. "
+                f"Must be one of: {sorted(ALLOWED_RELATIONSHIP_TYPES)}"
+            )
+        
+        rows = [
+            {'from_id': from_id, 'to_id': to_id, 'type': rel_type}
+            for from_id, to_id, rel_type in edges
+        ]
+        
+        try:
+            with self.session() as session:
+                created_edges = session.execute_write(self._merge_edges, rows)
+            self.invalidate_graph_cache()
+            
+            logger.info(f"Upserted {len(created_edges)} of {len(rows)} edges")
+            return [self._edge_result(row, created_edges) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Error upserting edges: {e}")
+            raise
+    
+    def get_all_nodes_and_edges(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Retrieve all nodes and their relationships; use_cache=False always reads the database"""
+        if not self.driver:
+            raise Exception("Neo4j connection not available")
+        
+        try:
+            graph, cached_at = self._graph_cache
+            if use_cache and graph is not None and time.monotonic() - cached_at < GRAPH_CACHE_TTL_SECONDS:
+                return graph
+            generation = self._graph_generation
+            
+            def _read_graph(tx):
+                # Nodes and edges arrive together in one result, consumed as it streams in
                 nodes = []
-                for record in nodes_result:
-                    nodes.append({
-                        'id': record['id'],
-                        'name': record['name'],
-                        'description': record['description'],
-                        'layer': record['layer'],
-                        'type': record['type']
-                    })
-                
-                # Get all relationships
-                edges_query = """
-                MATCH (a:Node)-[r]->(b:Node)
-                RETURN a.id as from_id, b.id as to_id, type(r) as relationship_type
-                """
-                
-                edges_result = session.run(edges_query)
                 edges = []
-                for record in edges_result:
-                    edges.append({
-                        'from_id': record['from_id'],
-                        'to_id': record['to_id'],
-                        'type': record['relationship_type']
-                    })
+                for record in tx.run(_Q_GET_GRAPH):
+                    nodes.append(record['node'])
+                    edges.extend(record['edges'])
                 
                 return {
                     'nodes': nodes,
                     'edges': edges
                 }
+            
+            with self.session() as session:
+                graph = session.execute_read(_read_graph)
+            
+            # A write that invalidated while this read ran may not be in the snapshot
+            with self._graph_cache_lock:
+                if generation == self._graph_generation:
+                    self._graph_cache = (graph, time.monotonic())
+            return graph
                 
         except Exception as e:
             logger.error(f"Error retrieving graph data: {e}")
@@ -194,18 +911,12 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                query = """
-                MATCH (n:Node {id: $node_id})
-                DETACH DELETE n
-                RETURN count(n) as deleted_count
-                """
-                
-                result = session.run(query, {'node_id': node_id})
-                record = result.single()
-                
-                return record['deleted_count'] > 0 if record else False
-                
+            _, summary, _ = self.driver.execute_query(
+                _Q_DELETE_NODE, {'node_id': node_id}, database_=self._db, routing_=RoutingControl.WRITE
+            )
+            self.invalidate_graph_cache()
+            return summary.counters.nodes_deleted > 0
+            
         except Exception as e:
             logger.error(f"Error deleting node: {e}")
             raise
@@ -216,28 +927,16 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                if relationship_type:
-                    query = f"""
-                    MATCH (a:Node {{id: $from_id}})-[r:{relationship_type}]->(b:Node {{id: $to_id}})
-                    DELETE r
-                    RETURN count(r) as deleted_count
-                    """
-                else:
-                    query = """
-                    MATCH (a:Node {id: $from_id})-[r]->(b:Node {id: $to_id})
-                    DELETE r
-                    RETURN count(r) as deleted_count
-                    """
-                
-                result = session.run(query, {
-                    'from_id': from_id,
-                    'to_id': to_id
-                })
-                
-                record = result.single()
-                return record['deleted_count'] > 0 if record else False
-                
+            # A null relationship_type matches edges of any type
+            _, summary, _ = self.driver.execute_query(_Q_DELETE_EDGE, {
+                'from_id': from_id,
+                'to_id': to_id,
+                'relationship_type': relationship_type or None
+            }, database_=self._db, routing_=RoutingControl.WRITE)
+            self.invalidate_graph_cache()
+            
+            return summary.counters.relationships_deleted > 0
+            
         except Exception as e:
             logger.error(f"Error deleting edge: {e}")
             raise
@@ -248,35 +947,24 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # First, delete all nodes in the layer
-                delete_nodes_query = """
-                MATCH (n:Node {layer: $layer_name})
-                DETACH DELETE n
-                RETURN count(n) as deleted_count
-                """
-                
-                result = session.run(delete_nodes_query, {'layer_name': layer_name})
-                record = result.single()
-                deleted_count = record['deleted_count'] if record else 0
-                
-                # Also delete the custom layer definition if it exists
-                delete_custom_layer_query = """
-                MATCH (l:CustomLayer {name: $layer_name})
-                DELETE l
-                RETURN count(l) as deleted_layer_count
-                """
-                
-                layer_result = session.run(delete_custom_layer_query, {'layer_name': layer_name})
-                layer_record = layer_result.single()
-                deleted_layer_count = layer_record['deleted_layer_count'] if layer_record else 0
-                
-                if deleted_layer_count > 0:
-                    logger.info(f"Deleted custom layer definition: '{layer_name}'")
-                
-                logger.info(f"Deleted {deleted_count} nodes from layer '{layer_name}'")
-                return deleted_count
-                
+            # First, delete all nodes in the layer
+            with self.session() as session:
+                summary = session.run(_Q_DELETE_LAYER_NODES, {'layer_name': layer_name}).consume()
+            deleted_count = summary.counters.nodes_deleted
+            
+            # Also delete the custom layer definition if it exists
+            _, layer_summary, _ = self.driver.execute_query(
+                _Q_DELETE_CUSTOM_LAYER, {'layer_name': layer_name}, database_=self._db, routing_=RoutingControl.WRITE
+            )
+            deleted_layer_count = layer_summary.counters.nodes_deleted
+            self.invalidate_graph_cache()
+            
+            if deleted_layer_count > 0:
+                logger.info(f"Deleted custom layer definition: '{layer_name}'")
+            
+            logger.info(f"Deleted {deleted_count} nodes from layer '{layer_name}'")
+            return deleted_count
+            
         except Exception as e:
             logger.error(f"Error deleting layer: {e}")
             raise
@@ -287,17 +975,13 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # Only delete nodes that are NOT SavedGraph, SavedNode, or SavedEdge
-                query = """
-                MATCH (n) 
-                WHERE NOT n:SavedGraph AND NOT n:SavedNode AND NOT n:SavedEdge
-                DETACH DELETE n
-                """
-                session.run(query)
-                logger.info("All main graph data cleared (saved graphs preserved)")
-                return True
-                
+            # Only delete nodes that are NOT SavedGraph, SavedNode, or SavedEdge
+            with self.session() as session:
+                session.run(_Q_CLEAR_ALL_DATA).consume()
+            self.invalidate_graph_cache()
+            logger.info("All main graph data cleared (saved graphs preserved)")
+            return True
+            
         except Exception as e:
             logger.error(f"Error clearing graph data: {e}")
             raise
@@ -379,20 +1063,24 @@ class Neo4jService:
         ]
         
         try:
-            # Clear existing data first
-            self.clear_all_data()
+            created_nodes = sample_nodes
+            edge_rows = [
+                {'from_id': from_id, 'to_id': to_id, 'type': rel_type}
+                for from_id, to_id, rel_type in sample_edges
+            ]
             
-            # Create nodes
-            created_nodes = []
-            for node_data in sample_nodes:
-                created_node = self.create_node(node_data)
-                created_nodes.append(created_node)
+            def _populate(tx):
+                # Clear existing data and write the sample graph in one transaction, so
+                # the old graph is replaced atomically and is kept if anything fails
+                tx.run(_Q_CLEAR_ALL_DATA_TX).consume()
+                self._merge_nodes(tx, created_nodes)
+                return self._merge_edges(tx, edge_rows)
             
-            # Create edges
-            created_edges = []
-            for from_id, to_id, rel_type in sample_edges:
-                edge = self.create_edge(from_id, to_id, rel_type)
-                created_edges.append(edge)
+            with self.session() as session:
+                created = session.execute_write(_populate)
+            self.invalidate_graph_cache()
+            
+            created_edges = [self._edge_result(row, created) for row in edge_rows]
             
             logger.info(f"Sample data populated: {len(created_nodes)} nodes, {len(created_edges)} edges")
             
@@ -417,86 +1105,44 @@ class Neo4jService:
             raise ValueError(f"Invalid graph_type '{graph_type}'. Must be one of: {valid_types}")
         
         try:
-            with self.driver.session() as session:
-                # First, delete any existing saved nodes and edges with the same graph name
-                delete_nodes_query = """
-                MATCH (sn:SavedNode {graph_name: $graph_name})
-                DELETE sn
-                """
-                session.run(delete_nodes_query, {'graph_name': graph_name})
-                
-                delete_edges_query = """
-                MATCH (se:SavedEdge {graph_name: $graph_name})
-                DELETE se
-                """
-                session.run(delete_edges_query, {'graph_name': graph_name})
-                
-                # Delete existing SavedGraph node if it exists
-                delete_graph_query = """
-                MATCH (sg:SavedGraph {name: $graph_name})
-                DELETE sg
-                """
-                session.run(delete_graph_query, {'graph_name': graph_name})
-                
-                # Create a new saved graph node with graph_type
-                create_graph_query = """
-                CREATE (sg:SavedGraph {
-                    name: $graph_name,
-                    graph_type: $graph_type,
-                    created_at: datetime(),
-                    nodes_count: $nodes_count,
-                    edges_count: $edges_count
-                })
-                RETURN sg
-                """
-                
-                session.run(create_graph_query, {
+            # Run the whole save as one managed transaction so it commits once
+            # and is retried as a unit on transient errors
+            def _save(tx):
+                # First, delete any existing saved graph, nodes and edges with the same name
+                # in one statement; each OPTIONAL MATCH is collapsed back to a single row
+                tx.run(_Q_PURGE_SAVED_GRAPH, {'graph_name': graph_name}).consume()
+                
+                # Create the saved graph node with graph_type, then all nodes and edges
+                tx.run(_Q_SAVE_GRAPH, {
                     'graph_name': graph_name,
                     'graph_type': graph_type,
-                    'nodes_count': len(graph_data['nodes']),
-                    'edges_count': len(graph_data['edges'])
-                })
-                
-                # Save all nodes
-                for node in graph_data['nodes']:
-                    save_node_query = """
-                    CREATE (sn:SavedNode {
-                        graph_name: $graph_name,
-                        id: $id,
-                        name: $name,
-                        description: $description,
-                        layer: $layer,
-                        type: $type
-                    })
-                    """
-                    session.run(save_node_query, {
-                        'graph_name': graph_name,
-                        'id': node['id'],
-                        'name': node['name'],
-                        'description': node['description'],
-                        'layer': node['layer'],
-                        'type': node['type']
-                    })
-                
-                # Save all edges
-                for edge in graph_data['edges']:
-                    save_edge_query = """
-                    CREATE (se:SavedEdge {
-                        graph_name: $graph_name,
-                        from_id: $from_id,
-                        to_id: $to_id,
-                        type: $type
-                    })
-                    """
-                    session.run(save_edge_query, {
-                        'graph_name': graph_name,
-                        'from_id': edge['from_id'],
-                        'to_id': edge['to_id'],
-                        'type': edge['type']
-                    })
-                
-                logger.info(f"Graph '{graph_name}' saved successfully with type '{graph_type}'")
-                return True
+                    'now': _utcnow(),
+                    'nodes': [
+                        {
+                            'id': node['id'],
+                            'name': node['name'],
+                            'description': node['description'],
+                            'layer': node['layer'],
+                            'type': node['type']
+                        }
+                        for node in graph_data['nodes']
+                    ],
+                    'edges': [
+                        {
+                            'from_id': edge['from_id'],
+                            'to_id': edge['to_id'],
+                            'type': edge['type']
+                        }
+                        for edge in graph_data['edges']
+                    ]
+                }).consume()
+            
+            with self.session() as session:
+                session.execute_write(_save)
+            self.invalidate_saved_graphs_cache()
+            
+            logger.info(f"Graph '{graph_name}' saved successfully with type '{graph_type}'")
+            return True
                 
         except Exception as e:
             logger.error(f"Error saving graph '{graph_name}': {e}")
@@ -508,43 +1154,30 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # Build query with optional graph_type filter
-                if graph_type:
-                    # Validate graph_type parameter
-                    valid_types = ["nfr", "application_architecture"]
-                    if graph_type not in valid_types:
-                        raise ValueError(f"Invalid graph_type '{graph_type}'. Must be one of: {valid_types}")
-                    
-                    query = """
-                    MATCH (sg:SavedGraph {graph_type: $graph_type})
-                    RETURN sg.name as name, sg.graph_type as graph_type, sg.created_at as created_at, 
-                           sg.nodes_count as nodes_count, sg.edges_count as edges_count
-                    ORDER BY sg.created_at DESC
-                    """
-                    result = session.run(query, {'graph_type': graph_type})
-                else:
-                    query = """
-                    MATCH (sg:SavedGraph)
-                    RETURN sg.name as name, 
-                           COALESCE(sg.graph_type, 'nfr') as graph_type,
-                           sg.created_at as created_at, 
-                           sg.nodes_count as nodes_count, sg.edges_count as edges_count
-                    ORDER BY sg.created_at DESC
-                    """
-                    result = session.run(query)
-                
-                graphs = []
-                for record in result:
-                    graphs.append({
-                        'name': record['name'],
-                        'graph_type': record['graph_type'],
-                        'created_at': record['created_at'].isoformat() if record['created_at'] else None,
-                        'nodes_count': record['nodes_count'],
-                        'edges_count': record['edges_count']
-                    })
-                
-                return graphs
+            # Validate graph_type parameter
+            if graph_type:
+                valid_types = ["nfr", "application_architecture"]
+                if graph_type not in valid_types:
+                    raise ValueError(f"Invalid graph_type '{graph_type}'. Must be one of: {valid_types}")
+            
+            cached = self._saved_graphs_cache.get(graph_type)
+            if cached and time.monotonic() - cached[0] < SAVED_GRAPHS_CACHE_TTL_SECONDS:
+                return cached[1]
+            
+            # Build query with optional graph_type filter
+            if graph_type:
+                graphs = self.driver.execute_query(
+                    _Q_GET_SAVED_GRAPHS_BY_TYPE, {'graph_type': graph_type},
+                    database_=self._db, routing_=RoutingControl.READ, result_transformer_=Result.data
+                )
+            else:
+                graphs = self.driver.execute_query(
+                    _Q_GET_SAVED_GRAPHS,
+                    database_=self._db, routing_=RoutingControl.READ, result_transformer_=Result.data
+                )
+            
+            self._saved_graphs_cache[graph_type] = (time.monotonic(), graphs)
+            return graphs
                 
         except Exception as e:
             logger.error(f"Error getting saved graphs: {e}")
@@ -556,53 +1189,14 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # Check if the saved graph exists
-                check_query = """
-                MATCH (sg:SavedGraph {name: $graph_name})
-                RETURN count(sg) as count
-                """
-                result = session.run(check_query, {'graph_name': graph_name})
-                if result.single()['count'] == 0:
-                    return None
-                
-                # Get saved nodes
-                nodes_query = """
-                MATCH (sn:SavedNode {graph_name: $graph_name})
-                RETURN sn.id as id, sn.name as name, sn.description as description,
-                       sn.layer as layer, sn.type as type
-                """
-                
-                nodes_result = session.run(nodes_query, {'graph_name': graph_name})
-                nodes = []
-                for record in nodes_result:
-                    nodes.append({
-                        'id': record['id'],
-                        'name': record['name'],
-                        'description': record['description'],
-                        'layer': record['layer'],
-                        'type': record['type']
-                    })
-                
-                # Get saved edges
-                edges_query = """
-                MATCH (se:SavedEdge {graph_name: $graph_name})
-                RETURN se.from_id as from_id, se.to_id as to_id, se.type as type
-                """
-                
-                edges_result = session.run(edges_query, {'graph_name': graph_name})
-                edges = []
-                for record in edges_result:
-                    edges.append({
-                        'from_id': record['from_id'],
-                        'to_id': record['to_id'],
-                        'type': record['type']
-                    })
-                
-                return {
-                    'nodes': nodes,
-                    'edges': edges
-                }
+            records, _, _ = self.driver.execute_query(
+                _Q_GET_SAVED_GRAPH_DATA, {'graph_name': graph_name}, database_=self._db, routing_=RoutingControl.READ
+            )
+            if not records:
+                return None
+            
+            # The projections already carry exactly the response keys
+            return records[0].data()
                 
         except Exception as e:
             logger.error(f"Error getting saved graph data '{graph_name}': {e}")
@@ -614,96 +1208,61 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # Check if the saved graph exists
-                check_query = """
-                MATCH (sg:SavedGraph {name: $graph_name})
-                RETURN count(sg) as count
-                """
-                result = session.run(check_query, {'graph_name': graph_name})
-                if result.single()['count'] == 0:
-                    return False
-                
-                # Load saved nodes
-                nodes_query = """
-                MATCH (sn:SavedNode {graph_name: $graph_name})
-                RETURN sn.id as id, sn.name as name, sn.description as description,
-                       sn.layer as layer, sn.type as type
-                """
-                
-                nodes_result = session.run(nodes_query, {'graph_name': graph_name})
-                for record in nodes_result:
-                    # Create the actual node
-                    create_node_query = """
-                    MERGE (n:Node {id: $id})
-                    SET n.name = $name,
-                        n.description = $description,
-                        n.layer = $layer,
-                        n.type = $type,
-                        n.created_at = datetime(),
-                        n.updated_at = datetime()
-                    """
-                    session.run(create_node_query, {
-                        'id': record['id'],
-                        'name': record['name'],
-                        'description': record['description'],
-                        'layer': record['layer'],
-                        'type': record['type']
-                    })
-                
-                # Load saved edges
-                edges_query = """
-                MATCH (se:SavedEdge {graph_name: $graph_name})
-                RETURN se.from_id as from_id, se.to_id as to_id, se.type as type
-                """
-                
-                edges_result = session.run(edges_query, {'graph_name': graph_name})
-                for record in edges_result:
-                    # Create the actual edge
-                    create_edge_query = f"""
-                    MATCH (a:Node {{id: $from_id}})
-                    MATCH (b:Node {{id: $to_id}})
-                    MERGE (a)-[r:{record['type']}]->(b)
-                    SET r.created_at = datetime()
-                    """
-                    session.run(create_edge_query, {
-                        'from_id': record['from_id'],
-                        'to_id': record['to_id']
-                    })
-                
-                logger.info(f"Graph '{graph_name}' loaded successfully")
-                return True
+            # Rebuild the graph from the saved copy server-side in one statement
+            records, _, _ = self.driver.execute_query(
+                _Q_LOAD_SAVED_GRAPH, {'graph_name': graph_name, 'now': _utcnow()},
+                database_=self._db, routing_=RoutingControl.WRITE
+            )
+            if not records:
+                return False
+            self.invalidate_graph_cache()
+            
+            logger.info(f"Graph '{graph_name}' loaded successfully")
+            return True
                 
         except Exception as e:
             logger.error(f"Error loading graph '{graph_name}': {e}")
             raise
 
+    def update_saved_graph_type(self, graph_name: str, graph_type: str) -> bool:
+        """Change the type of a saved graph; returns False if it doesn't exist"""
+        if not self.driver:
+            raise Exception("Neo4j connection not available")
+        
+        valid_types = ["nfr", "application_architecture"]
+        if graph_type not in valid_types:
+            raise ValueError(f"Invalid graph_type '{graph_type}'. Must be one of: {valid_types}")
+        
+        try:
+            records, _, _ = self.driver.execute_query(_Q_UPDATE_SAVED_GRAPH_TYPE, {
+                'graph_name': graph_name,
+                'graph_type': graph_type
+            }, database_=self._db, routing_=RoutingControl.WRITE)
+            
+            if not records:
+                return False
+            
+            self.invalidate_saved_graphs_cache()
+            logger.info(f"Graph '{graph_name}' type updated to '{graph_type}'")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error updating type of graph '{graph_name}': {e}")
+            raise
+
     def delete_saved_graph(self, graph_name: str) -> bool:
         """Delete a saved graph by name"""
         try:
-            with self.driver.session() as session:
-                # Check if graph exists
-                result = session.run(
-                    "MATCH (g:SavedGraph {name: $name}) RETURN g",
-                    name=graph_name
-                )
-                
-                if not result.single():
-                    return False
-                
-                # Delete the saved graph and all its data
-                session.run(
-                    """
-                    MATCH (g:SavedGraph {name: $name})
-                    OPTIONAL MATCH (g)-[:CONTAINS_NODE]->(n:SavedNode)
-                    OPTIONAL MATCH (g)-[:CONTAINS_EDGE]->(e:SavedEdge)
-                    DETACH DELETE g, n, e
-                    """,
-                    name=graph_name
-                )
-                
-                logger.info(f"✅ Deleted saved graph: {graph_name}")
-                return True
+            # Delete the saved graph and all its data; nothing matches if it doesn't exist
+            records, _, _ = self.driver.execute_query(
+                _Q_DELETE_SAVED_GRAPH, {'name': graph_name}, database_=self._db, routing_=RoutingControl.WRITE
+            )
+            if records[0]['deleted'] == 0:
+                return False
+            self.invalidate_saved_graphs_cache()
+            
+            logger.info(f"✅ Deleted saved graph: {graph_name}")
+            return True
                 
         except Exception as e:
             logger.error(f"❌ Error deleting saved graph {graph_name}: {e}")
@@ -712,14 +1271,13 @@ class Neo4jService:
     def get_custom_layers(self) -> List[str]:
         """Get all custom layers that have been created"""
         try:
-            with self.driver.session() as session:
-                result = session.run(
-                    "MATCH (l:CustomLayer) RETURN l.name as name ORDER BY l.name"
-                )
-                
-                layers = [record["name"] for record in result]
-                logger.info(f"✅ Retrieved {len(layers)} custom layers")
-                return layers
+            records, _, _ = self.driver.execute_query(
+                _Q_GET_CUSTOM_LAYERS, database_=self._db, routing_=RoutingControl.READ
+            )
+            
+            layers = [record["name"] for record in records]
+            logger.info(f"✅ Retrieved {len(layers)} custom layers")
+            return layers
                 
         except Exception as e:
             logger.error(f"❌ Error getting custom layers: {e}")
@@ -728,20 +1286,12 @@ class Neo4jService:
     def get_all_layers(self) -> List[str]:
         """Get all layers (both custom and from existing nodes)"""
         try:
-            # Get custom layers
-            custom_layers = self.get_custom_layers()
-            
-            # Get layers from existing nodes
-            with self.driver.session() as session:
-                result = session.run(
-                    "MATCH (n:Node) WHERE n.layer IS NOT NULL RETURN DISTINCT n.layer as layer ORDER BY layer"
-                )
-                
-                node_layers = [record["layer"] for record in result]
+            # UNION deduplicates custom and node layers server-side in one round-trip
+            records, _, _ = self.driver.execute_query(
+                _Q_GET_ALL_LAYERS, database_=self._db, routing_=RoutingControl.READ
+            )
             
-            # Combine all layers and remove duplicates
-            all_layers = list(set(custom_layers + node_layers))
-            all_layers.sort()
+            all_layers = [record["layer"] for record in records]
             
             logger.info(f"✅ Retrieved {len(all_layers)} total layers")
             return all_layers
@@ -753,43 +1303,19 @@ class Neo4jService:
     def create_custom_layer(self, layer_name: str, description: str = "") -> Dict[str, Any]:
         """Create a new custom layer"""
         try:
-            with self.driver.session() as session:
-                # Check if layer already exists
-                existing_result = session.run(
-                    "MATCH (l:CustomLayer {name: $name}) RETURN l",
-                    name=layer_name
-                )
-                
-                if existing_result.single():
-                    raise ValueError(f"Layer '{layer_name}' already exists")
-                
-                # Create the custom layer
-                result = session.run(
-                    """
-                    CREATE (l:CustomLayer {
-                        name: $name,
-                        description: $description,
-                        created_at: datetime()
-                    })
-                    RETURN l
-                    """,
-                    name=layer_name,
-                    description=description
-                )
-                
-                record = result.single()
-                if record:
-                    layer_node = record["l"]
-                    created_layer = {
-                        "name": layer_node["name"],
-                        "description": layer_node["description"],
-                        "created_at": layer_node["created_at"].isoformat() if layer_node["created_at"] else None
-                    }
-                    
-                    logger.info(f"✅ Created custom layer: {layer_name}")
-                    return created_layer
-                else:
-                    raise Exception("Failed to create custom layer")
+            records, summary, _ = self.driver.execute_query(_Q_CREATE_CUSTOM_LAYER, {
+                'name': layer_name,
+                'description': description
+            }, database_=self._db, routing_=RoutingControl.WRITE)
+            
+            if summary.counters.nodes_created == 0:
+                raise LayerExistsError(f"Layer '{layer_name}' already exists")
+            
+            created_layer = records[0]['layer']
+            created_layer['created_at'] = _isoformat(created_layer['created_at'])
+            
+            logger.info(f"✅ Created custom layer: {layer_name}")
+            return created_layer
                 
         except Exception as e:
             logger.error(f"❌ Error creating custom layer {layer_name}: {e}")
@@ -801,52 +1327,22 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # First check if the node exists
-                check_query = """
-                MATCH (n:Node {id: $node_id})
-                RETURN n
-                """
-                
-                result = session.run(check_query, {'node_id': node_id})
-                if not result.single():
-                    raise Exception(f"Node with id '{node_id}' not found")
-                
-                # Update the node
-                query = """
-                MATCH (n:Node {id: $node_id})
-                SET n.name = $name,
-                    n.description = $description,
-                    n.layer = $layer,
-                    n.type = $type,
-                    n.updated_at = datetime()
-                RETURN n
-                """
-                
-                result = session.run(query, {
-                    'node_id': node_id,
-                    'name': node_data['name'],
-                    'description': node_data.get('description', ''),
-                    'layer': node_data.get('layer', ''),
-                    'type': node_data.get('type', '')
-                })
-                
-                record = result.single()
-                if record:
-                    node = record['n']
-                    updated_node = {
-                        'id': node['id'],
-                        'name': node['name'],
-                        'description': node['description'],
-                        'layer': node['layer'],
-                        'type': node['type']
-                    }
-                    
-                    logger.info(f"Updated node: {node_id}")
-                    return updated_node
-                
-                raise Exception("Failed to update node")
-                
+            # A missing node simply matches nothing, so no separate existence check
+            records, _, _ = self.driver.execute_query(_Q_UPDATE_NODE, {
+                'node_id': node_id,
+                'name': node_data['name'],
+                'description': node_data.get('description', ''),
+                'layer': node_data.get('layer', ''),
+                'type': node_data.get('type', '')
+            }, database_=self._db, routing_=RoutingControl.WRITE)
+            
+            if records:
+                self.invalidate_graph_cache()
+                logger.info(f"Updated node: {node_id}")
+                return records[0]['node']
+            
+            raise Exception(f"Node with id '{node_id}' not found")
+            
         except Exception as e:
             logger.error(f"Error updating node: {e}")
             raise
@@ -857,83 +1353,33 @@ class Neo4jService:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                new_layer_name = new_layer_data.get('name', old_layer_name)
-                new_description = new_layer_data.get('description', '')
-                
-                # Check if the custom layer exists
-                check_query = """
-                MATCH (l:CustomLayer {name: $old_name})
-                RETURN l
-                """
-                
-                result = session.run(check_query, {'old_name': old_layer_name})
-                custom_layer_exists = result.single() is not None
-                
-                # If renaming to a different name, check if new name already exists
-                if new_layer_name != old_layer_name:
-                    existing_layers = self.get_all_layers()
-                    if new_layer_name in existing_layers:
-                        raise Exception(f"Layer '{new_layer_name}' already exists")
-                
-                # Update or create the custom layer
-                if custom_layer_exists:
-                    update_layer_query = """
-                    MATCH (l:CustomLayer {name: $old_name})
-                    SET l.name = $new_name,
-                        l.description = $description,
-                        l.updated_at = datetime()
-                    RETURN l
-                    """
-                    
-                    session.run(update_layer_query, {
-                        'old_name': old_layer_name,
-                        'new_name': new_layer_name,
-                        'description': new_description
-                    })
-                else:
-                    # Create new custom layer if it doesn't exist
-                    create_layer_query = """
-                    CREATE (l:CustomLayer {
-                        name: $new_name,
-                        description: $description,
-                        created_at: datetime(),
-                        updated_at: datetime()
-                    })
-                    RETURN l
-                    """
-                    
-                    session.run(create_layer_query, {
-                        'new_name': new_layer_name,
-                        'description': new_description
-                    })
-                
-                # If layer name changed, update all nodes in that layer
-                if new_layer_name != old_layer_name:
-                    update_nodes_query = """
-                    MATCH (n:Node {layer: $old_name})
-                    SET n.layer = $new_name,
-                        n.updated_at = datetime()
-                    RETURN count(n) as updated_count
-                    """
-                    
-                    result = session.run(update_nodes_query, {
-                        'old_name': old_layer_name,
-                        'new_name': new_layer_name
-                    })
-                    
-                    record = result.single()
-                    updated_count = record['updated_count'] if record else 0
-                    
-                    logger.info(f"Updated {updated_count} nodes from layer '{old_layer_name}' to '{new_layer_name}'")
-                
-                logger.info(f"Updated custom layer: '{old_layer_name}' -> '{new_layer_name}'")
-                
-                return {
-                    'name': new_layer_name,
-                    'description': new_description,
-                    'old_name': old_layer_name
-                }
+            new_layer_name = new_layer_data.get('name', old_layer_name)
+            new_description = new_layer_data.get('description', '')
+            
+            # Update (or create) the custom layer and move its nodes in a single statement;
+            # the CustomLayer.name constraint backs up the in-query name check
+            records, _, _ = self.driver.execute_query(_Q_UPDATE_CUSTOM_LAYER, {
+                'old_name': old_layer_name,
+                'new_name': new_layer_name,
+                'description': new_description,
+                'now': _utcnow()
+            }, database_=self._db, routing_=RoutingControl.WRITE)
+            
+            record = records[0]
+            if record['name_taken']:
+                raise Exception(f"Layer '{new_layer_name}' already exists")
+            
+            if new_layer_name != old_layer_name:
+                self.invalidate_graph_cache()
+                logger.info(f"Updated {record['updated_count']} nodes from layer '{old_layer_name}' to '{new_layer_name}'")
+            
+            logger.info(f"Updated custom layer: '{old_layer_name}' -> '{new_layer_name}'")
+            
+            return {
+                'name': new_layer_name,
+                'description': new_description,
+                'old_name': old_layer_name
+            }
                 
         except Exception as e:
             logger.error(f"Error updating custom layer: {e}")
@@ -941,105 +1387,114 @@ class Neo4jService:
 
     def export_graph_data(self, include_metadata: bool = True) -> Dict[str, Any]:
         """Export complete graph data in a structured JSON format"""
+        # Same document the export route streams, collected in memory
+        return json.loads(''.join(self.iter_export_json(include_metadata)))
+
+    def get_graph_summary(self) -> Dict[str, Any]:
+        """Export statistics for the current graph, aggregated without fetching its rows"""
         if not self.driver:
             raise Exception("Neo4j connection not available")
         
         try:
-            with self.driver.session() as session:
-                # Get all nodes with their properties
-                nodes_query = """
-                MATCH (n:Node)
-                RETURN n.id as id, n.name as name, n.description as description, 
-                       n.layer as layer, n.type as type,
-                       n.created_at as created_at, n.updated_at as updated_at
-                ORDER BY n.layer, n.name
-                """
-                
-                nodes_result = session.run(nodes_query)
-                nodes = []
-                for record in nodes_result:
-                    node_data = {
-                        'id': record['id'],
-                        'name': record['name'],
-                        'description': record['description'],
-                        'layer': record['layer'],
-                        'type': record['type']
-                    }
-                    
-                    # Include timestamps if metadata is requested
-                    if include_metadata:
-                        node_data.update({
-                            'created_at': record['created_at'].isoformat() if record['created_at'] else None,
-                            'updated_at': record['updated_at'].isoformat() if record['updated_at'] else None
-                        })
-                    
-                    nodes.append(node_data)
-                
-                # Get all relationships with their properties
-                edges_query = """
-                MATCH (a:Node)-[r]->(b:Node)
-                RETURN a.id as from_id, b.id as to_id, type(r) as relationship_type,
-                       r.created_at as created_at
-                """
-                
-                edges_result = session.run(edges_query)
-                edges = []
-                for record in edges_result:
-                    edge_data = {
-                        'from_id': record['from_id'],
-                        'to_id': record['to_id'],
-                        'type': record['relationship_type']
-                    }
+            def _read_summary(tx):
+                return tx.run(_Q_LAYER_STATISTICS).data(), tx.run(_Q_RELATIONSHIP_STATISTICS).data()
+            
+            with self.session() as session:
+                layer_rows, relationship_rows = session.execute_read(_read_summary)
+            custom_layers = self.get_custom_layers()
+            
+            summary = _graph_summary(layer_rows, relationship_rows, custom_layers)
+            summary['custom_layers'] = custom_layers
+            return summary
+            
+        except Exception as e:
+            logger.error(f"❌ Error summarizing graph data: {e}")
+            raise
+
+    def iter_export_json(self, include_metadata: bool = True) -> Iterator[str]:
+        """Yield the export document as JSON text in chunks of about EXPORT_CHUNK_SIZE characters"""
+        if not self.driver:
+            raise Exception("Neo4j connection not available")
+        
+        # Statistics are accumulated while rows stream past, so neither the rows
+        # nor the serialized document are ever held in memory as a whole
+        layers = set()
+        node_types = set()
+        relationship_types = set()
+        layer_stats = {}
+        node_count = 0
+        edge_count = 0
+        
+        try:
+            custom_layers = self.get_custom_layers()
+            
+            with self.session(default_access_mode=READ_ACCESS) as session:
+                # The node query is sent before anything is yielded, so a caller priming the
+                # generator sees connection and query errors before it commits to a response
+                nodes_query = _Q_EXPORT_NODES_WITH_METADATA if include_metadata else _Q_EXPORT_NODES
+                node_records = session.run(nodes_query)
+                
+                buffer = ['{"format_version": "1.0", "export_timestamp": '
+                          + json.dumps(datetime.now().isoformat()) + ', "graph_data": {"nodes": [']
+                buffered = len(buffer[0])
+                
+                for record in node_records:
+                    node = record.data()
+                    if node['layer']:
+                        layers.add(node['layer'])
+                    stats = layer_stats.setdefault(node['layer'] or 'Other', {'nodes': 0, 'types': set()})
+                    stats['nodes'] += 1
+                    # Nodes without a type are counted but, as with collect() in
+                    # _Q_LAYER_STATISTICS, contribute no type
+                    if node['type'] is not None:
+                        node_types.add(node['type'])
+                        stats['types'].add(node['type'])
                     
-                    # Include timestamps if metadata is requested
-                    if include_metadata:
-                        edge_data['created_at'] = record['created_at'].isoformat() if record['created_at'] else None
+                    row = ('\n' if node_count == 0 else ',\n') + json.dumps(node, ensure_ascii=False)
+                    node_count += 1
+                    buffer.append(row)
+                    buffered += len(row)
+                    if buffered >= EXPORT_CHUNK_SIZE:
+                        yield ''.join(buffer)
+                        buffer, buffered = [], 0
+                
+                buffer.append('\n], "edges": [')
+                edges_query = _Q_EXPORT_EDGES_WITH_METADATA if include_metadata else _Q_EXPORT_EDGES
+                for record in session.run(edges_query):
+                    edge = record.data()
+                    relationship_types.add(edge['type'])
                     
-                    edges.append(edge_data)
-                
-                # Get custom layers
-                custom_layers = self.get_custom_layers()
-                
-                # Build export data structure
-                export_data = {
-                    'format_version': '1.0',
-                    'export_timestamp': datetime.now().isoformat(),
-                    'graph_data': {
-                        'nodes': nodes,
-                        'edges': edges,
-                        'custom_layers': custom_layers
-                    },
-                    'statistics': {
-                        'total_nodes': len(nodes),
-                        'total_edges': len(edges),
-                        'total_layers': len(set(node['layer'] for node in nodes if node['layer'])),
-                        'custom_layers_count': len(custom_layers)
-                    }
+                    row = ('\n' if edge_count == 0 else ',\n') + json.dumps(edge, ensure_ascii=False)
+                    edge_count += 1
+                    buffer.append(row)
+                    buffered += len(row)
+                    if buffered >= EXPORT_CHUNK_SIZE:
+                        yield ''.join(buffer)
+                        buffer, buffered = [], 0
+            
+            statistics = {
+                'total_nodes': node_count,
+                'total_edges': edge_count,
+                'total_layers': len(layers),
+                'custom_layers_count': len(custom_layers)
+            }
+            buffer.append('\n], "custom_layers": ' + json.dumps(custom_layers, ensure_ascii=False)
+                          + '}, "statistics": ' + json.dumps(statistics))
+            
+            if include_metadata:
+                for stats in layer_stats.values():
+                    stats['types'] = list(stats['types'])
+                metadata = {
+                    'layer_statistics': layer_stats,
+                    'relationship_types': list(relationship_types),
+                    'node_types': list(node_types)
                 }
-                
-                if include_metadata:
-                    # Add layer statistics
-                    layer_stats = {}
-                    for node in nodes:
-                        layer = node['layer'] or 'Other'
-                        if layer not in layer_stats:
-                            layer_stats[layer] = {'nodes': 0, 'types': set()}
-                        layer_stats[layer]['nodes'] += 1
-                        layer_stats[layer]['types'].add(node['type'])
-                    
-                    # Convert sets to lists for JSON serialization
-                    for layer in layer_stats:
-                        layer_stats[layer]['types'] = list(layer_stats[layer]['types'])
-                    
-                    export_data['metadata'] = {
-                        'layer_statistics': layer_stats,
-                        'relationship_types': list(set(edge['type'] for edge in edges)),
-                        'node_types': list(set(node['type'] for node in nodes))
-                    }
-                
-                logger.info(f"✅ Graph data exported: {len(nodes)} nodes, {len(edges)} edges")
-                return export_data
-                
+                buffer.append(', "metadata": ' + json.dumps(metadata, ensure_ascii=False))
+            
+            buffer.append('}')
+            yield ''.join(buffer)
+            logger.info(f"✅ Graph data exported: {node_count} nodes, {edge_count} edges")
+            
         except Exception as e:
             logger.error(f"❌ Error exporting graph data: {e}")
             raise
@@ -1060,152 +1515,108 @@ class Neo4jService:
                 return validation_result
             
             graph_data = import_data['graph_data']
-            nodes = graph_data['nodes']
-            edges = graph_data['edges']
             custom_layers = graph_data.get('custom_layers', [])
+            node_rows, edge_rows = _import_rows(graph_data)
             
-            import_stats = {
-                'nodes_created': 0,
-                'nodes_updated': 0,
-                'edges_created': 0,
-                'layers_created': 0,
-                'errors': []
-            }
+            in_batches = len(node_rows) + len(edge_rows) > IMPORT_IN_TRANSACTIONS_THRESHOLD
+            
+            # A batched import can't share a transaction, so its clear commits up front
+            if clear_existing and in_batches:
+                self.clear_all_data()
+                logger.info("Cleared existing graph data before import")
             
-            with self.driver.session() as session:
-                # Clear existing data if requested
+            def _import(tx):
+                # The clear, layers, nodes and edges commit together, so a failed import leaves
+                # the graph untouched; a retry reruns everything, so only return what was written
                 if clear_existing:
-                    self.clear_all_data()
-                    logger.info("Cleared existing graph data before import")
+                    tx.run(_Q_CLEAR_ALL_DATA_TX).consume()
                 
-                # Create custom layers first
-                for layer_name in custom_layers:
-                    try:
-                        create_layer_query = """
-                        MERGE (l:CustomLayer {name: $layer_name})
-                        SET l.created_at = datetime()
-                        RETURN l
-                        """
-                        result = session.run(create_layer_query, {'layer_name': layer_name})
-                        if result.single():
-                            import_stats['layers_created'] += 1
-                    except Exception as e:
-                        import_stats['errors'].append(f"Error creating layer '{layer_name}': {str(e)}")
+                layers_created = 0
+                if custom_layers:
+                    summary = tx.run(_Q_IMPORT_CUSTOM_LAYERS, {'names': custom_layers, 'now': _utcnow()}).consume()
+                    layers_created = summary.counters.nodes_created
                 
-                # Import nodes
-                for node in nodes:
-                    try:
-                        # Check if node already exists
-                        check_query = "MATCH (n:Node {id: $id}) RETURN n"
-                        existing = session.run(check_query, {'id': node['id']}).single()
-                        
-                        if existing:
-                            # Update existing node
-                            update_query = """
-                            MATCH (n:Node {id: $id})
-                            SET n.name = $name,
-                                n.description = $description,
-                                n.layer = $layer,
-                                n.type = $type,
-                                n.updated_at = datetime()
-                            RETURN n
-                            """
-                            session.run(update_query, {
-                                'id': node['id'],
-                                'name': node['name'],
-                                'description': node['description'],
-                                'layer': node['layer'],
-                                'type': node['type']
-                            })
-                            import_stats['nodes_updated'] += 1
-                        else:
-                            # Create new node
-                            create_query = """
-                            CREATE (n:Node {
-                                id: $id,
-                                name: $name,
-                                description: $description,
-                                layer: $layer,
-                                type: $type,
-                                created_at: datetime(),
-                                updated_at: datetime()
-                            })
-                            RETURN n
-                            """
-                            session.run(create_query, {
-                                'id': node['id'],
-                                'name': node['name'],
-                                'description': node['description'],
-                                'layer': node['layer'],
-                                'type': node['type']
-                            })
-                            import_stats['nodes_created'] += 1
-                            
-                    except Exception as e:
-                        import_stats['errors'].append(f"Error importing node '{node['id']}': {str(e)}")
+                # One UNWIND MERGE for all nodes; whatever MERGE didn't create already
+                # existed and was updated in place
+                nodes_created = self._merge_nodes(tx, node_rows)
                 
-                # Import edges
-                for edge in edges:
-                    try:
-                        # Check if both nodes exist
-                        check_nodes_query = """
-                        MATCH (a:Node {id: $from_id})
-                        MATCH (b:Node {id: $to_id})
-                        RETURN a, b
-                        """
-                        nodes_exist = session.run(check_nodes_query, {
-                            'from_id': edge['from_id'],
-                            'to_id': edge['to_id']
-                        }).single()
-                        
-                        if not nodes_exist:
-                            import_stats['errors'].append(
-                                f"Cannot create edge {edge['from_id']} -> {edge['to_id']}: one or both nodes don't exist"
-                            )
-                            continue
-                        
-                        # Create edge (MERGE to avoid duplicates)
-                        create_edge_query = f"""
-                        MATCH (a:Node {{id: $from_id}})
-                        MATCH (b:Node {{id: $to_id}})
-                        MERGE (a)-[r:{edge['type']}]->(b)
-                        SET r.created_at = datetime()
-                        RETURN r
-                        """
-                        result = session.run(create_edge_query, {
-                            'from_id': edge['from_id'],
-                            'to_id': edge['to_id']
-                        })
-                        
-                        if result.single():
-                            import_stats['edges_created'] += 1
-                            
-                    except Exception as e:
-                        import_stats['errors'].append(f"Error importing edge {edge['from_id']} -> {edge['to_id']}: {str(e)}")
-                
-                # Save as named graph if graph_name is provided
-                if graph_name:
-                    try:
-                        current_graph_data = self.get_all_nodes_and_edges()
-                        self.save_graph(graph_name, current_graph_data)
-                        logger.info(f"Imported graph saved as '{graph_name}'")
-                    except Exception as e:
-                        import_stats['errors'].append(f"Error saving imported graph as '{graph_name}': {str(e)}")
-                
-                logger.info(f"✅ Graph import completed: {import_stats}")
-                
-                return {
-                    'success': True,
-                    'message': 'Graph data imported successfully',
-                    'statistics': import_stats,
-                    'total_errors': len(import_stats['errors'])
-                }
+                # One UNWIND through APOC for all edges (the type stays data, never query
+                # text); rows whose endpoints don't match come back missing from the result
+                return layers_created, nodes_created, self._merge_edges(tx, edge_rows)
+            
+            if in_batches:
+                layers_created, nodes_created, created_edges = self._import_in_batches(
+                    custom_layers, node_rows, edge_rows
+                )
+            else:
+                with self.session() as session:
+                    layers_created, nodes_created, created_edges = session.execute_write(_import)
+            self.invalidate_graph_cache()
+            
+            import_stats = _import_statistics(layers_created, nodes_created, node_rows, edge_rows, created_edges)
+            
+            # Save as named graph if graph_name is provided
+            if graph_name:
+                try:
+                    self.save_graph(graph_name, self._graph_after_import(clear_existing, node_rows, edge_rows, created_edges))
+                    logger.info(f"Imported graph saved as '{graph_name}'")
+                except Exception as e:
+                    import_stats['errors'].append(f"Error saving imported graph as '{graph_name}': {str(e)}")
+            
+            logger.info(f"✅ Graph import completed: {import_stats}")
+            
+            return {
+                'success': True,
+                'message': 'Graph data imported successfully',
+                'statistics': import_stats,
+                'warnings': validation_result['warnings'],
+                'total_errors': len(import_stats['errors'])
+            }
                 
         except Exception as e:
             logger.error(f"❌ Error importing graph data: {e}")
             raise
 
-    def _validate_import_data(self, import_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _graph_after_import(self, clear_existing: bool, node_rows: List[Dict[str, Any]],
+                            edge_rows: List[Dict[str, Any]], created_edges: set) -> Dict[str, Any]:
+        """The main graph as it stands after an import, for saving it under a name"""
+        if not clear_existing:
+            # Nodes that were already in the graph are part of it too, so read it back; the
+            # cache could miss edits made by other worker processes within its TTL
+            return self.get_all_nodes_and_edges(use_cache=False)
+        
+        # After a clear the graph is exactly what was just written
+        return {
+            'nodes': node_rows,
+            'edges': [
+                edge for edge in edge_rows
+                if (edge['from_id'], edge['to_id'], edge['type']) in created_edges
+            ]
+        }
+
+    def _import_in_batches(self, custom_layers: List[str], node_rows: List[Dict[str, Any]],
+                           edge_rows: List[Dict[str, Any]]) -> Tuple[int, int, set]:
+        """Import a very large graph with server-side batched commits (not atomic as a whole)"""
+        now = _utcnow()
+        
+        # CALL {} IN TRANSACTIONS only runs in an auto-commit transaction (session.run)
+        with self.session() as session:
+            layers_created = 0
+            if custom_layers:
+                summary = session.run(_Q_IMPORT_CUSTOM_LAYERS, {'names': custom_layers, 'now': now}).consume()
+                layers_created = summary.counters.nodes_created
+            
+            summary = session.run(_Q_IMPORT_NODES_IN_TRANSACTIONS, {'rows': node_rows, 'now': now}).consume()
+            nodes_created = summary.counters.nodes_created
+            
+            result = session.run(_Q_IMPORT_EDGES_IN_TRANSACTIONS, {'rows': edge_rows, 'now': now})
+            created_edges = {(record['from_id'], record['to_id'], record['type']) for record in result}
+        
+        logger.info(f"Imported {len(node_rows)} nodes and {len(edge_rows)} edges in server-side batches")
+        return layers_created, nodes_created, created_edges
+
+    @staticmethod
+    def _validate_import_data(import_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate the structure and content of import data"""
         errors = []
         warnings = []
@@ -1245,25 +1656,28 @@ class Neo4jService:
         if errors:
             return {'valid': False, 'errors': errors, 'warnings': warnings}
         
-        # Validate nodes
-        node_ids = set()
+        # Size caps come first, so an oversized file is refused without building id sets
+        if len(graph_data['nodes']) > IMPORT_MAX_NODES:
+            errors.append(f"Too many nodes: {len(graph_data['nodes'])} (limit {IMPORT_MAX_NODES})")
+        if len(graph_data['edges']) > IMPORT_MAX_EDGES:
+            errors.append(f"Too many edges: {len(graph_data['edges'])} (limit {IMPORT_MAX_EDGES})")
+        
+        if errors:
+            return {'valid': False, 'errors': errors, 'warnings': warnings}
+        
+        # Validate nodes; the per-field breakdown only runs for rows that fail the quick check
         for i, node in enumerate(graph_data['nodes']):
             if not isinstance(node, dict):
                 errors.append(f'Node at index {i} must be an object')
-                continue
-            
-            # Check required node fields
-            required_fields = ['id', 'name', 'layer', 'type']
-            for field in required_fields:
-                if field not in node:
-                    errors.append(f'Node at index {i} missing required field: {field}')
-                elif not isinstance(node[field], str):
-                    errors.append(f'Node at index {i} field {field} must be a string')
-            
-            if 'id' in node:
-                if node['id'] in node_ids:
-                    errors.append(f'Duplicate node ID: {node["id"]}')
-                node_ids.add(node['id'])
+            elif not all(isinstance(node.get(field), str) for field in _IMPORT_NODE_FIELDS):
+                errors.extend(_field_errors('Node', i, node, _IMPORT_NODE_FIELDS))
+        
+        # Duplicates are counted in one pass, and only when the id set is smaller than the id list
+        ids = [node['id'] for node in graph_data['nodes'] if isinstance(node, dict) and 'id' in node]
+        node_ids = set(ids)
+        if len(node_ids) != len(ids):
+            for node_id, count in Counter(ids).items():
+                errors.extend([f'Duplicate node ID: {node_id}'] * (count - 1))
         
         # Validate edges
         for i, edge in enumerate(graph_data['edges']):
@@ -1271,13 +1685,15 @@ class Neo4jService:
                 errors.append(f'Edge at index {i} must be an object')
                 continue
             
-            # Check required edge fields
-            required_fields = ['from_id', 'to_id', 'type']
-            for field in required_fields:
-                if field not in edge:
-                    errors.append(f'Edge at index {i} missing required field: {field}')
-                elif not isinstance(edge[field], str):
-                    errors.append(f'Edge at index {i} field {field} must be a string')
+            if not all(isinstance(edge.get(field), str) for field in _IMPORT_EDGE_FIELDS):
+                errors.extend(_field_errors('Edge', i, edge, _IMPORT_EDGE_FIELDS))
+            elif _normalize_relationship_type(edge['type']) not in ALLOWED_RELATIONSHIP_TYPES:
+                # Same whitelist create_edge enforces; exports of older graphs may carry other
+                # types, so those edges are skipped rather than failing the whole import
+                warnings.append(
+                    f"Edge at index {i} has unsupported relationship type '{edge['type']}' and will be skipped. "
+                    f"Supported types: {sorted(ALLOWED_RELATIONSHIP_TYPES)}"
+                )
             
             # Check if referenced nodes exist
             if 'from_id' in edge and edge['from_id'] not in node_ids:
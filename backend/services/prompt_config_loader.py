@@ -1,17 +1,74 @@
 import json
 import logging
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson  # Native parser, noticeably faster on config (re)loads
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYSTEM_PROMPT = "You are an expert AI coding assistant."
+
+# Default configuration file, relative to the repository root
+_DEFAULT_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "prompt_config.json"
+
+# Used when the configuration has no file_patterns section
+_DEFAULT_FILE_PATTERNS: Dict[str, List[str]] = {
+    "extensions": ["py", "js", "ts", "java", "cpp"],
+    "regex_patterns": []
+}
+
+# Built once at import; used whenever the configuration file cannot be loaded
+_FALLBACK_CONFIG: Dict[str, Any] = {
+    "system_prompts": {
+        "default": "You are an expert AI coding assistant. Provide detailed, actionable specifications for coding projects.",
+        "full_specification": "You are an expert business analyst and technical architect specializing in comprehensive project planning. Create detailed functional and non-functional specifications with complete task breakdowns. Your specifications should include clear business benefits, detailed task lists, and proper testing phases.",
+        "enhanced_prompt": "You are an expert AI coding assistant specializing in structured implementation planning. Create clear 8-12 step implementation plans where each step includes both functional and non-functional requirements. Focus on actionable steps with clear requirement alignment.",
+        "rephrase": "You are an expert technical writer specializing in prompt optimization. Your task is to rephrase user input to make it more concise, clear, and effective for LLM processing while preserving the original intent and requirements."
+    },
+    
+    "validation_rules": {
+        "min_prompt_length": 10,
+        "max_file_display": 10,
+        "max_components_per_layer": 10,
+        "max_total_components": 50
+    },
+    
+    "file_patterns": {
+        "extensions": [
+            "py", "js", "ts", "tsx", "java", "cpp", "c", "h", "hpp",
+            "css", "scss", "html", "json", "xml", "yaml", "yml"
+        ],
+        "regex_patterns": [
+            "`([^`]+\\.[a-zA-Z0-9]+)`",
+            "([a-zA-Z0-9_/.-]+\\.[a-zA-Z0-9]+)",
+            "(\\w+\\.py)",
+            "(\\w+\\.js)",
+            "(\\w+\\.tsx?)",
+            "(\\w+\\.java)"
+        ]
+    }
+}
+
 class PromptConfigLoader:
     """
     Utility class for loading and managing prompt configuration from JSON file.
     Provides a clean interface for accessing configuration data with fallbacks.
     """
     
+    # Parsed configs shared across instances:
+    # resolved path -> ((mtime_ns, size), config, ISO timestamp of the parse)
+    _CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any], str]] = {}
+    
+    # Deprecation messages already logged by _warn_deprecated
+    _deprecation_warned: set = set()
+    
     def __init__(self, config_path: str = None):
         """
         Initialize the configuration loader.
@@ -20,26 +77,86 @@ class PromptConfigLoader:
             config_path: Path to the configuration file. If None, uses default path.
         """
         if config_path is None:
-            # Default path relative to the backend directory
-            current_dir = Path(__file__).parent.parent.parent
-            config_path = current_dir / "config" / "prompt_config.json"
+            config_path = _DEFAULT_CONFIG_PATH
         
         self.config_path = Path(config_path)
-        self.config = self._load_config()
+        self._last_loaded_iso: Optional[str] = None
+        self._config_exists = False
+    
+    # Precomputed views the hot-path getters read; dropped whenever the config is reloaded
+    _VIEWS = (
+        "_system_prompts", "_default_prompt", "_validation_rules",
+        "_file_patterns", "_compiled_file_patterns",
+        "_config_status",
+    )
+    
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Configuration data, loaded on first access instead of at construction."""
+        return self._load_config()
+    
+    @cached_property
+    def _system_prompts(self) -> Dict[str, str]:
+        return self.config.get("system_prompts", {})
     
-    def _load_config(self) -> Dict[str, Any]:
+    @cached_property
+    def _default_prompt(self) -> str:
+        return self._system_prompts.get("default", DEFAULT_SYSTEM_PROMPT)
+    
+    @cached_property
+    def _validation_rules(self) -> Dict[str, Any]:
+        return self.config.get("validation_rules", {})
+    
+    @cached_property
+    def _file_patterns(self) -> Dict[str, List[str]]:
+        return self.config.get("file_patterns", _DEFAULT_FILE_PATTERNS)
+    
+    @cached_property
+    def _compiled_file_patterns(self) -> List[re.Pattern]:
+        return self._compile_file_patterns()
+    
+    def _clear_views(self) -> None:
+        """Drop the precomputed views so they are rebuilt from the current config."""
+        for name in self._VIEWS:
+            self.__dict__.pop(name, None)
+    
+    def _compile_file_patterns(self) -> List[re.Pattern]:
+        """Compile the configured file regex patterns once, skipping invalid ones."""
+        compiled = []
+        for pattern in self._file_patterns.get("regex_patterns", []):
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                logger.warning(f"Invalid regex pattern {pattern}: {str(e)}")
+        return compiled
+    
+    def _load_config(self, use_cache: bool = True) -> Dict[str, Any]:
         """Load configuration from JSON file with error handling."""
         try:
-            if not self.config_path.exists():
-                logger.warning(f"Configuration file not found: {self.config_path}")
-                return self._get_fallback_config()
+            # stat() doubles as the existence check; a missing file raises FileNotFoundError
+            st = self.config_path.stat()
+            self._config_exists = True
+            cache_key = str(self.config_path.resolve())
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = self._CACHE.get(cache_key)
+            if use_cache and cached and cached[0] == stamp:
+                # Report when the file was actually parsed, not when the cache was hit
+                self._last_loaded_iso = cached[2]
+                return cached[1]
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                logger.info(f"Successfully loaded configuration from {self.config_path}")
-                return config
+            data = self.config_path.read_bytes()
+            config = orjson.loads(data) if orjson else json.loads(data)
+            self._last_loaded_iso = datetime.now().isoformat()
+            self._CACHE[cache_key] = (stamp, config, self._last_loaded_iso)
+            logger.info(f"Successfully loaded configuration from {self.config_path}")
+            return config
                 
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            self._config_exists = False
+            logger.warning(f"Configuration file not found: {self.config_path}")
+            return self._get_fallback_config()
+        except (json.JSONDecodeError, ValueError) as e:
+            # orjson.JSONDecodeError subclasses ValueError
             logger.error(f"Invalid JSON in configuration file: {e}")
             return self._get_fallback_config()
         except Exception as e:
@@ -50,37 +167,9 @@ class PromptConfigLoader:
         """
         Provide a minimal fallback configuration if loading fails.
         Updated to remove unused enhancement_instructions and focus on system_prompts.
+        The shared module-level dict is returned as-is; callers only read it.
         """
-        return {
-            "system_prompts": {
-                "default": "You are an expert AI coding assistant. Provide detailed, actionable specifications for coding projects.",
-                "full_specification": "You are an expert business analyst and technical architect specializing in comprehensive project planning. Create detailed functional and non-functional specifications with complete task breakdowns. Your specifications should include clear business benefits, detailed task lists, and proper testing phases.",
-                "enhanced_prompt": "You are an expert AI coding assistant specializing in structured implementation planning. Create clear 8-12 step implementation plans where each step includes both functional and non-functional requirements. Focus on actionable steps with clear requirement alignment.",
-                "rephrase": "You are an expert technical writer specializing in prompt optimization. Your task is to rephrase user input to make it more concise, clear, and effective for LLM processing while preserving the original intent and requirements."
-            },
-            
-            "validation_rules": {
-                "min_prompt_length": 10,
-                "max_file_display": 10,
-                "max_components_per_layer": 10,
-                "max_total_components": 50
-            },
-            
-            "file_patterns": {
-                "extensions": [
-                    "py", "js", "ts", "tsx", "java", "cpp", "c", "h", "hpp",
-                    "css", "scss", "html", "json", "xml", "yaml", "yml"
-                ],
-                "regex_patterns": [
-                    "`([^`]+\\.[a-zA-Z0-9]+)`",
-                    "([a-zA-Z0-9_/.-]+\\.[a-zA-Z0-9]+)",
-                    "(\\w+\\.py)",
-                    "(\\w+\\.js)",
-                    "(\\w+\\.tsx?)",
-                    "(\\w+\\.java)"
-                ]
-            }
-        }
+        return _FALLBACK_CONFIG
 
     def get_system_prompt(self, prompt_type: str = "default") -> str:
         """
@@ -93,13 +182,15 @@ class PromptConfigLoader:
         Returns:
             System prompt string
         """
-        try:
-            system_prompts = self.config.get("system_prompts", {})
-            return system_prompts.get(prompt_type, system_prompts.get("default", "You are an expert AI coding assistant."))
-        except Exception as e:
-            logger.error(f"Error getting system prompt for type '{prompt_type}': {str(e)}")
-            return "You are an expert AI coding assistant."
+        return self._system_prompts.get(prompt_type, self._default_prompt)
 
+    @classmethod
+    def _warn_deprecated(cls, message: str) -> None:
+        """Log a deprecation warning once per process rather than on every call."""
+        if message not in cls._deprecation_warned:
+            cls._deprecation_warned.add(message)
+            logger.warning(message)
+    
     def get_task_context(self, task_type: str) -> str:
         """
         Get task context - deprecated but maintained for backward compatibility.
@@ -111,7 +202,7 @@ class PromptConfigLoader:
         Returns:
             Empty string (task contexts removed)
         """
-        logger.warning("get_task_context is deprecated - task contexts have been removed from the system")
+        self._warn_deprecated("get_task_context is deprecated - task contexts have been removed from the system")
         return ""
 
     def get_task_guidelines(self, task_type: str) -> List[str]:
@@ -125,7 +216,7 @@ class PromptConfigLoader:
         Returns:
             Empty list (task guidelines removed)
         """
-        logger.warning("get_task_guidelines is deprecated - task guidelines have been removed from the system")
+        self._warn_deprecated("get_task_guidelines is deprecated - task guidelines have been removed from the system")
         return []
     
     def get_architecture_guidelines(self) -> List[str]:
@@ -147,8 +238,7 @@ class PromptConfigLoader:
         Returns:
             Rule value or None if not found
         """
-        validation_rules = self.config.get("validation_rules", {})
-        return validation_rules.get(rule_name)
+        return self._validation_rules.get(rule_name)
     
     def get_prompt_template(self, template_name: str) -> str:
         """
@@ -170,10 +260,16 @@ class PromptConfigLoader:
         Returns:
             Dictionary containing file extensions and regex patterns
         """
-        return self.config.get("file_patterns", {
-            "extensions": ["py", "js", "ts", "java", "cpp"],
-            "regex_patterns": []
-        })
+        return self._file_patterns
+    
+    def get_compiled_file_patterns(self) -> List[re.Pattern]:
+        """
+        Get the file detection regex patterns, compiled once per (re)load.
+        
+        Returns:
+            List of compiled regex patterns
+        """
+        return self._compiled_file_patterns
     
     def reload_config(self) -> bool:
         """
@@ -183,7 +279,8 @@ class PromptConfigLoader:
             True if reload was successful, False otherwise
         """
         try:
-            self.config = self._load_config()
+            self.config = self._load_config(use_cache=False)
+            self._clear_views()
             logger.info("Configuration reloaded successfully")
             return True
         except Exception as e:
@@ -194,27 +291,52 @@ class PromptConfigLoader:
         """
         Get comprehensive status information about the configuration.
         Updated to reflect the removal of enhancement_instructions and focus on system_prompts.
+        Built once per (re)load and shared between calls; treat it as read-only.
         
         Returns:
             Dict containing configuration status and statistics
         """
-        try:
-            return {
-                "config_loaded": bool(self.config),
-                "config_path": str(self.config_path),
-                "config_exists": self.config_path.exists(),
-                "system_prompts_count": len(self.config.get("system_prompts", {})),
-                "validation_rules_count": len(self.config.get("validation_rules", {})),
-                "file_patterns_count": len(self.config.get("file_patterns", {}).get("extensions", [])),
-                "available_system_prompts": list(self.config.get("system_prompts", {}).keys()),
-                "architecture_aware": True,
-                "dynamic_prompts_enabled": True,
-                "last_loaded": datetime.now().isoformat()
-            }
-        except Exception as e:
-            logger.error(f"Error getting config status: {str(e)}")
-            return {
-                "config_loaded": False,
-                "error": str(e),
-                "last_loaded": datetime.now().isoformat()
-            } 
\ No newline at end of file
+        return self._config_status
+    
+    @cached_property
+    def _config_status(self) -> Dict[str, Any]:
+        config_loaded = bool(self.config)
+        system_prompts = self._system_prompts
+        return {
+            "config_loaded": config_loaded,
+            "config_path": str(self.config_path),
+            "config_exists": self._config_exists,
+            "system_prompts_count": len(system_prompts),
+            "validation_rules_count": len(self._validation_rules),
+            "file_patterns_count": len(self._file_patterns.get("extensions", [])),
+            "available_system_prompts": list(system_prompts.keys()),
+            "architecture_aware": True,
+            "dynamic_prompts_enabled": True,
+            "last_loaded": self._last_loaded_iso
+        }
+
+
+@lru_cache(maxsize=None)
+def _loader_for(config_path: str) -> PromptConfigLoader:
+    """One loader per resolved configuration path; see get_loader."""
+    return PromptConfigLoader(config_path)
+
+
+def get_loader(config_path: Optional[str] = None) -> PromptConfigLoader:
+    """
+    Get the shared loader instance for a configuration path.
+    
+    The path is resolved first, so None, relative and absolute spellings of
+    the same file share one loader. reload_config() on the returned loader
+    refreshes it in place for every caller; use _loader_for.cache_clear()
+    to force brand new instances.
+    
+    Args:
+        config_path: Path to the configuration file. If None, uses default path.
+        
+    Returns:
+        Cached PromptConfigLoader instance
+    """
+    if config_path is None:
+        config_path = _DEFAULT_CONFIG_PATH
+    return _loader_for(str(Path(config_path).resolve()))
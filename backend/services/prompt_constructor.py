@@ -1,7 +1,7 @@
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from .prompt_config_loader import PromptConfigLoader
+from .prompt_config_loader import get_loader
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,7 @@ class PromptConstructor:
     def __init__(self, bedrock_service=None, config_service=None):
         self.bedrock_service = bedrock_service
         self.config_service = config_service
-        self.prompt_config = PromptConfigLoader()
+        self.prompt_config = get_loader()
         
     def construct_enhanced_prompt(
         self, 
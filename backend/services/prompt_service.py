@@ -1,6 +1,6 @@
 import logging
 from typing import List, Dict, Any, Optional, Union
-from .prompt_config_loader import PromptConfigLoader
+from .prompt_config_loader import get_loader
 from .prompt_constructor import PromptConstructor
 
 logger = logging.getLogger(__name__)
@@ -11,7 +11,7 @@ class PromptService:
     def __init__(self, bedrock_service, neo4j_service=None):
         self.bedrock_service = bedrock_service
         self.neo4j_service = neo4j_service
-        self.prompt_config = PromptConfigLoader()
+        self.prompt_config = get_loader()
         self.prompt_constructor = PromptConstructor(bedrock_service)
     
     def enhance_prompt(
@@ -304,20 +304,11 @@ class PromptService:
     
     def _extract_file_references(self, prompt: str) -> List[str]:
         """Extract file references from prompt text"""
-        import re
-        
-        # Get file patterns from config
-        file_patterns = self.prompt_config.get_file_patterns()
-        regex_patterns = file_patterns.get('regex_patterns', [])
-        
+        # Patterns are compiled (and invalid ones dropped) when the config loads
         file_references = []
         
-        for pattern in regex_patterns:
-            try:
-                matches = re.findall(pattern, prompt)
-                file_references.extend(matches)
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern {pattern}: {str(e)}")
+        for pattern in self.prompt_config.get_compiled_file_patterns():
+            file_references.extend(pattern.findall(prompt))
         
         # Remove duplicates and return
         return list(set(file_references))
@@ -53,7 +53,7 @@ const RequirementsEditor = () => {
   const [newEdge, setNewEdge] = useState({
     from_id: '',
     to_id: '',
-    type: 'depends_on'
+    type: 'DEPENDS_ON'
   });
 
   const [newLayer, setNewLayer] = useState({
@@ -328,7 +328,7 @@ const RequirementsEditor = () => {
       
       const result = await response.json();
       if (result.success) {
-        setNewEdge({ from_id: '', to_id: '', type: 'depends_on' });
+        setNewEdge({ from_id: '', to_id: '', type: 'DEPENDS_ON' });
         setShowAddEdge(false);
         fetchGraphData();
       } else {
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import services the way app.py does, relative to the backend directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'backend'))
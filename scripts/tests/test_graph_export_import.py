@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from services.neo4j_service import (
+    Neo4jService,
+    _import_rows,
+    _Q_LAYER_STATISTICS,
+    _Q_RELATIONSHIP_STATISTICS,
+)
+
+
+class _Record:
+    def __init__(self, data):
+        self._data = data
+
+    def data(self):
+        return dict(self._data)
+
+
+class _Rows(list):
+    def data(self):
+        return [record.data() for record in self]
+
+
+def _layer_statistics(nodes):
+    """What _Q_LAYER_STATISTICS returns: collect(DISTINCT) skips null types"""
+    groups = {}
+    for node in nodes:
+        group = groups.setdefault(node['layer'], {'layer': node['layer'], 'nodes': 0, 'types': []})
+        group['nodes'] += 1
+        if node['type'] is not None and node['type'] not in group['types']:
+            group['types'].append(node['type'])
+    return list(groups.values())
+
+
+def _relationship_statistics(edges):
+    counts = {}
+    for edge in edges:
+        counts[edge['type']] = counts.get(edge['type'], 0) + 1
+    return [{'type': rel_type, 'edges': count} for rel_type, count in counts.items()]
+
+
+class _Session:
+    """Answers the export and statistics queries with a fixed graph"""
+
+    def __init__(self, nodes, edges):
+        self._nodes = nodes
+        self._edges = edges
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, *args, **kwargs):
+        if query == _Q_LAYER_STATISTICS:
+            rows = _layer_statistics(self._nodes)
+        elif query == _Q_RELATIONSHIP_STATISTICS:
+            rows = _relationship_statistics(self._edges)
+        else:
+            rows = self._edges if "]->(" in query else self._nodes
+        return _Rows(_Record(row) for row in rows)
+
+    def execute_read(self, work):
+        return work(self)
+
+
+def _service(nodes, edges, custom_layers):
+    # Skip __init__ so no driver or write batcher is started
+    service = object.__new__(Neo4jService)
+    service.driver = object()
+    service.session = lambda **kwargs: _Session(nodes, edges)
+    service.get_custom_layers = lambda: custom_layers
+    return service
+
+
+NODES = [
+    {'id': 'api', 'name': 'API', 'description': '', 'layer': 'backend', 'type': 'component'},
+    {'id': 'db', 'name': 'DB', 'description': 'Storage', 'layer': 'data', 'type': 'component'},
+]
+
+
+@pytest.mark.parametrize("include_metadata", [True, False])
+def test_export_can_be_reimported(include_metadata):
+    """Test that an exported graph passes import validation unchanged"""
+    edges = [{'from_id': 'api', 'to_id': 'db', 'type': 'DEPENDS_ON'}]
+    service = _service(NODES, edges, ['backend'])
+
+    exported = json.loads(''.join(service.iter_export_json(include_metadata)))
+    result = Neo4jService._validate_import_data(exported)
+
+    assert result['valid'], result['errors']
+    assert result['warnings'] == []
+    node_rows, edge_rows = _import_rows(exported['graph_data'])
+    assert [row['id'] for row in node_rows] == ['api', 'db']
+    assert edge_rows == edges
+
+
+def test_export_with_legacy_edge_types_can_be_reimported():
+    """Test that edge types created before the whitelist don't block a re-import"""
+    edges = [
+        {'from_id': 'api', 'to_id': 'db', 'type': 'depends_on'},
+        {'from_id': 'db', 'to_id': 'api', 'type': 'RELATES_TO'},
+    ]
+    service = _service(NODES, edges, [])
+
+    exported = json.loads(''.join(service.iter_export_json(False)))
+    result = Neo4jService._validate_import_data(exported)
+
+    # Lowercase types are mapped onto the whitelist; unknown ones only warn and are skipped
+    assert result['valid'], result['errors']
+    assert len(result['warnings']) == 1
+    assert 'RELATES_TO' in result['warnings'][0]
+    _, edge_rows = _import_rows(exported['graph_data'])
+    assert edge_rows == [{'from_id': 'api', 'to_id': 'db', 'type': 'DEPENDS_ON'}]
+
+
+def test_export_metadata_matches_graph_summary_with_null_types():
+    """Test that the streamed export and the Cypher aggregates agree, including on untyped nodes"""
+    nodes = NODES + [
+        {'id': 'cache', 'name': 'Cache', 'description': '', 'layer': 'data', 'type': None},
+        {'id': 'misc', 'name': 'Misc', 'description': '', 'layer': None, 'type': None},
+        {'id': 'doc', 'name': 'Doc', 'description': '', 'layer': '', 'type': 'note'},
+    ]
+    edges = [{'from_id': 'api', 'to_id': 'db', 'type': 'DEPENDS_ON'}]
+    service = _service(nodes, edges, ['backend'])
+
+    exported = json.loads(''.join(service.iter_export_json(True)))
+    summary = service.get_graph_summary()
+
+    assert exported['statistics'] == summary['statistics']
+    assert sorted(exported['metadata']['node_types']) == sorted(summary['node_types']) == ['component', 'note']
+    assert exported['metadata']['relationship_types'] == summary['relationship_types']
+    exported_layers = exported['metadata']['layer_statistics']
+    assert exported_layers.keys() == summary['layer_statistics'].keys()
+    for layer, stats in summary['layer_statistics'].items():
+        assert exported_layers[layer]['nodes'] == stats['nodes']
+        assert sorted(exported_layers[layer]['types']) == sorted(stats['types'])
@@ -0,0 +1,159 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from neo4j.exceptions import ClientError, ServiceUnavailable
+
+from services import neo4j_service
+from services.neo4j_service import Neo4jService
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def consume(self):
+        class _Summary:
+            class counters:
+                nodes_created = 0
+        return _Summary()
+
+    def __iter__(self):
+        return iter(
+            {'from_id': row['from_id'], 'to_id': row['to_id'], 'type': row['type']}
+            for row in self._rows
+        )
+
+
+class _Session:
+    """Records committed rows; fails a transaction as told by the owning _Database"""
+
+    def __init__(self, db):
+        self._db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work):
+        db = self._db
+        db.transactions += 1
+        db.gate.wait()
+        pending = []
+
+        class _Tx:
+            def run(self, query, params):
+                rows = params['rows']
+                if db.error is not None:
+                    raise db.error
+                if any(row.get('id') == 'bad' for row in rows):
+                    raise ClientError("Cannot merge node using null property value")
+                pending.extend(rows)
+                return _Result(rows)
+
+        result = work(_Tx())
+        db.committed.extend(pending)
+        return result
+
+
+class _Driver:
+    def close(self):
+        pass
+
+
+class _Database:
+    def __init__(self):
+        self.committed = []
+        self.transactions = 0
+        self.error = None
+        self.gate = threading.Event()
+        self.gate.set()
+
+
+@pytest.fixture
+def service():
+    # Skip __init__ so no driver is created; only the write batcher is started
+    svc = object.__new__(Neo4jService)
+    svc.driver = _Driver()
+    svc.db = _Database()
+    svc.session = lambda **kwargs: _Session(svc.db)
+    svc.invalidate_graph_cache = lambda: None
+    svc._start_write_batcher()
+    yield svc
+    svc.db.gate.set()
+    svc.close()
+
+
+def _create_nodes_concurrently(svc, ids):
+    outcomes = {}
+
+    def _create(node_id):
+        try:
+            outcomes[node_id] = svc.create_node({'id': node_id, 'name': node_id})
+        except Exception as e:
+            outcomes[node_id] = e
+
+    threads = [threading.Thread(target=_create, args=(node_id,)) for node_id in ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_bad_row_only_fails_its_own_caller(service):
+    """Test that a row rejected by Neo4j doesn't fail the other writes in its batch"""
+    outcomes = _create_nodes_concurrently(service, ['a', 'bad', 'c'])
+
+    assert outcomes['a']['id'] == 'a'
+    assert outcomes['c']['id'] == 'c'
+    assert isinstance(outcomes['bad'], ClientError)
+    assert sorted(row['id'] for row in service.db.committed) == ['a', 'c']
+
+
+def test_transient_error_fails_batch_without_row_retries(service, monkeypatch):
+    """Test that a connection error fails every queued write at once instead of retrying each row"""
+    # A wide batching window keeps all three writes in one batch
+    monkeypatch.setattr(neo4j_service, 'WRITE_BATCH_WAIT_SECONDS', 0.5)
+    service.db.error = ServiceUnavailable("Neo4j is down")
+
+    outcomes = _create_nodes_concurrently(service, ['a', 'b', 'c'])
+
+    assert all(isinstance(outcome, ServiceUnavailable) for outcome in outcomes.values())
+    assert service.db.transactions == 1
+
+
+def test_timed_out_write_is_withdrawn(service, monkeypatch):
+    """Test that a write whose caller timed out while it was queued is never committed"""
+    monkeypatch.setattr(neo4j_service, 'WRITE_RESULT_TIMEOUT_SECONDS', 0.2)
+
+    # Hold the worker inside the first batch so the next write stays queued
+    service.db.gate.clear()
+    first = service._enqueue_write('node', {'id': 'first', 'name': 'first'})
+    while service.db.transactions == 0:
+        time.sleep(0.01)
+
+    with pytest.raises(TimeoutError):
+        service.create_node({'id': 'late', 'name': 'late'})
+
+    service.db.gate.set()
+    assert first.result(timeout=5)['id'] == 'first'
+    service.close()
+    assert [row['id'] for row in service.db.committed] == ['first']
+
+
+def test_close_flushes_queued_writes_and_rejects_new_ones(service):
+    """Test that close() commits what is queued, then refuses further writes"""
+    queued = service._enqueue_write('node', {'id': 'a', 'name': 'a'})
+
+    service.close()
+    service.close()
+
+    assert queued.result(timeout=0)['id'] == 'a'
+    with pytest.raises(Exception, match="closed"):
+        service._enqueue_write('node', {'id': 'b', 'name': 'b'})